@@ -0,0 +1,71 @@
+# benchmarks/catalogue.py
+import random
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from boardgamefinder.adapters.bgg_repository import COLS
+from evaluation.cases import TEST_CASES
+
+_WORDS = (
+    "ticket ride catan kolonisten party co monopoly risk pandemic azul carcassonne dominion "
+    "wingspan codenames scrabble cluedo stratego rummikub ganzenbord halli galli dixit mysterium "
+    "splendor terraforming mars gloomhaven root everdell cascadia king tokyo legacy europe "
+    "nederland amsterdam deluxe edition expansion world travel new questions junior kids dice "
+    "card game of the war lords empire quest dragon castle island harbor trains rails heroes "
+    "spel vragen reis editie wereld bever bert camel up oud nieuw koning ridder zee haven"
+).split()
+
+_SYNTHETIC_ID_START = 10_000_000  # Well above real BGG IDs, so they never collide
+
+
+def expected_games() -> Dict[int, str]:
+    """Returns the BGG ID -> name of every expected match in the evaluation cases."""
+    games: Dict[int, str] = {}
+    for case in TEST_CASES:
+        for match in case.expected_matches:
+            ids = match.get("id")
+            ids = [ids] if isinstance(ids, str) else (ids or [])
+            for bgg_id in ids:
+                if bgg_id and match.get("name"):
+                    games[int(bgg_id)] = match["name"]
+    return games
+
+
+def synthetic_catalogue(size: int, seed: int = 0, include: Optional[Dict[int, str]] = None) -> pd.DataFrame:
+    """
+    Generates a BGG-shaped DataFrame (`COLS`) of `size` unique game names.
+
+    The games in `include` (defaults to the evaluation cases' expected matches)
+    keep their real IDs, so matching the evaluation cases still finds them; the
+    rest are random titles and "Title: Subtitle" expansions built from a small
+    board game vocabulary, so fuzzy search sees realistic near-duplicates.
+    """
+    rng = random.Random(seed)
+    include = expected_games() if include is None else include
+    ids: List[int] = list(include)
+    names: List[str] = list(include.values())
+    seen = set(names)
+
+    next_id = _SYNTHETIC_ID_START
+    while len(names) < size:
+        name = " ".join(rng.choice(_WORDS).title() for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            name += ": " + " ".join(rng.choice(_WORDS).title() for _ in range(rng.randint(1, 3)))
+        if name in seen:
+            continue
+        seen.add(name)
+        ids.append(next_id)
+        names.append(name)
+        next_id += 1
+
+    n = len(names)
+    df = pd.DataFrame({
+        "BGGId": ids,
+        "Name": names,
+        "YearPublished": [1990 + rng.randrange(35) for _ in range(n)],
+        "GameWeight": [round(rng.uniform(1.0, 5.0), 2) for _ in range(n)],
+        "AvgRating": [round(rng.uniform(4.0, 9.0), 2) for _ in range(n)],
+        "ImagePath": [f"https://cf.geekdo-images.com/benchmark/{i}.jpg" for i in ids],
+    })
+    return df[COLS]
@@ -0,0 +1,259 @@
+# benchmarks/fakes.py
+import contextlib
+import copy
+import json
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Collection, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from unittest import mock
+
+import pandas as pd
+import requests
+from requests.adapters import BaseAdapter
+
+from boardgamefinder.adapters import marktplaats_client
+from boardgamefinder.adapters.bgg_repository import BGGRepository
+from boardgamefinder.adapters.firestore_repository import (
+    ListingCursor,
+    ListingRepository,
+    _to_stored_timestamp,
+)
+from boardgamefinder.adapters.llm_client import LLM, Message
+from boardgamefinder.adapters.ocr_client import OcrClient
+from boardgamefinder.domain.models import Listing
+from boardgamefinder.instrumentation import count, span
+from boardgamefinder.prompts import GAME_EXTRACT_SYSTEM, MATCHER_BATCH_SYSTEM_PROMPT
+
+from .fixtures import Fixture
+
+
+class DataFrameBGGRepository(BGGRepository):
+    """BGGRepository over an in-memory DataFrame, e.g. a synthetic catalogue."""
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+
+    def get_all_games(self) -> pd.DataFrame:
+        return self._df
+
+
+class FakeListingRepository(ListingRepository):
+    """
+    In-memory ListingRepository. Documents are stored as the same JSON dicts that
+    are written to Firestore, so serialization costs and field projections match.
+    """
+
+    def __init__(self):
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _project(self, doc: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+        if fields is None:
+            return copy.deepcopy(doc)
+        return {field: copy.deepcopy(doc[field]) for field in fields if field in doc}
+
+    def _snapshot(self) -> List[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            docs = list(self._docs.items())
+        count("firestore.reads", len(docs))
+        return docs
+
+    def find_by_link(self, link: str) -> Optional[Listing]:
+        return self.find_many_by_links([link]).get(link)
+
+    def find_many_by_links(self, links: Collection[str]) -> Dict[str, Listing]:
+        count("firestore.reads", len(links))
+        with self._lock:
+            docs = {link: self._docs.get(self._doc_id_from_link(link)) for link in links}
+        return {link: Listing.model_validate(doc) for link, doc in docs.items() if doc is not None}
+
+    def get_page(
+        self,
+        page_size: int = 500,
+        cursor: Optional[ListingCursor] = None,
+        since: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Union[Listing, Dict[str, Any]]], Optional[ListingCursor]]:
+        docs = sorted(self._snapshot(), key=lambda item: (item[1]["created_at"], item[0]))
+        if since is not None:
+            bound = _to_stored_timestamp(since)
+            docs = [(doc_id, doc) for doc_id, doc in docs if doc["created_at"] >= bound]
+        if cursor is not None:
+            docs = [
+                (doc_id, doc) for doc_id, doc in docs
+                if (doc["created_at"], doc_id) > (cursor.created_at, cursor.doc_id)
+            ]
+        page = docs[:page_size]
+        next_cursor = None
+        if len(page) == page_size:
+            last_id, last = page[-1]
+            next_cursor = ListingCursor(created_at=last["created_at"], doc_id=last_id)
+        if fields is not None:
+            fields = sorted(set(fields) | {"created_at"})
+        return self._convert([doc for _, doc in page], fields), next_cursor
+
+    def _convert(
+        self, docs: List[Dict[str, Any]], fields: Optional[Sequence[str]], validate: bool = True
+    ) -> List[Union[Listing, Dict[str, Any]]]:
+        if fields is not None or not validate:
+            return [self._project(doc, fields) for doc in docs]
+        return [Listing.model_validate(doc) for doc in docs]
+
+    def latest(self, n: int, fields: Optional[Sequence[str]] = None) -> List[Union[Listing, Dict[str, Any]]]:
+        docs = sorted(self._snapshot(), key=lambda item: item[1]["created_at"], reverse=True)
+        return self._convert([doc for _, doc in docs[:n]], fields)
+
+    def iter_pages(
+        self,
+        page_size: int = 500,
+        fields: Optional[Sequence[str]] = None,
+        validate: bool = True,
+        start_after: Optional[str] = None,
+    ) -> Iterator[Tuple[List[Union[Listing, Dict[str, Any]]], str]]:
+        docs = sorted(self._snapshot())
+        if start_after:
+            docs = [(doc_id, doc) for doc_id, doc in docs if doc_id > start_after]
+        for start in range(0, len(docs), page_size):
+            page = docs[start:start + page_size]
+            yield self._convert([doc for _, doc in page], fields, validate), page[-1][0]
+
+    def get_updated_since(
+        self, since: datetime, fields: Optional[Sequence[str]] = None
+    ) -> List[Union[Listing, Dict[str, Any]]]:
+        bound = _to_stored_timestamp(since)
+        docs = [doc for _, doc in self._snapshot() if doc["updated_at"] >= bound]
+        return self._convert(docs, fields)
+
+    def save(self, listing: Listing) -> None:
+        self.save_many([listing])
+
+    def save_many(self, listings: List[Listing], existing_links: Optional[Collection[str]] = None) -> None:
+        now = datetime.now(timezone.utc)
+        with span("firestore.batch_commit"), self._lock:
+            for listing in listings:
+                doc_id = self._doc_id_from_link(str(listing.link))
+                listing.updated_at = now
+                existing = self._docs.get(doc_id)
+                if existing is None:
+                    listing.created_at = now
+                    self._docs[doc_id] = listing.model_dump(mode="json")
+                else:
+                    existing.update(listing.model_dump(mode="json", exclude={"created_at"}))
+        count("firestore.writes", len(listings))
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+
+class FakeOcrClient(OcrClient):
+    """OcrClient that returns recorded OCR texts instead of calling Google Vision."""
+
+    def __init__(self, fixtures: List[Fixture]):
+        self.url_cache = None
+        self.content_cache = None
+        self._texts = {url: text for f in fixtures for url, text in f["ocr_texts"].items()}
+
+    def extract_text_from_urls(self, image_urls: List[str]) -> List[str]:
+        count("ocr.images", len(image_urls))
+        return [self._texts.get(url, "") for url in image_urls]
+
+
+class ReplayLLM(LLM):
+    """
+    LLM that replays recorded extraction responses (looked up by listing title)
+    and answers matcher prompts with the first candidate of every game, after an
+    optional simulated network `latency` in seconds.
+    """
+
+    _TITLE = re.compile(r"^Title:\n(.*?)\n\nDescription:", re.S)
+    _CANDIDATE_ID = re.compile(r"- ID: (\d+)")
+
+    def __init__(self, fixtures: List[Fixture], latency: float = 0.0):
+        self.model = "replay"
+        self.latency = latency
+        self._extractions = {f["title"]: f["extraction_response"] for f in fixtures}
+
+    def get_response(self, messages: List[Message], temperature: float = 0.0, **kwargs) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        count("llm.calls")
+        system, user = messages[0]["content"], messages[-1]["content"]
+
+        if system == GAME_EXTRACT_SYSTEM:
+            title = self._TITLE.match(user)
+            return self._extractions.get(title.group(1) if title else "", "[]")
+        if system == MATCHER_BATCH_SYSTEM_PROMPT:
+            answers = {}
+            for block in re.split(r"^Game (\d+):$", user, flags=re.M)[1:]:
+                if block.isdigit():
+                    number = block
+                    continue
+                candidate = self._CANDIDATE_ID.search(block)
+                answers[number] = candidate.group(1) if candidate else None
+            return json.dumps(answers)
+        candidate = self._CANDIDATE_ID.search(user)
+        return candidate.group(1) if candidate else "None"
+
+
+class _FakeLocation:
+    def __init__(self, city: str, distance: int):
+        self.city = city
+        self.distance = distance
+
+
+class _FakeSearchResult:
+    """Stands in for a `marktplaats` search result."""
+
+    def __init__(self, fixture: Fixture):
+        self.link = fixture["link"]
+        self.title = fixture["title"]
+        self.description = fixture["description"][:100]
+        self.price = fixture["price"]
+        self.price_type = fixture["price_type"]
+        self.location = _FakeLocation(fixture["city"], fixture["distance_m"])
+        self.date = datetime.fromisoformat(fixture["date"])
+        self._images = fixture["images"]
+
+    def get_images(self) -> List[str]:
+        return list(self._images)
+
+
+class _FixtureAdapter(BaseAdapter):
+    """requests transport adapter serving recorded detail pages."""
+
+    def __init__(self, pages: Dict[str, str], **_):
+        super().__init__()
+        self._pages = pages
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        html = self._pages.get(request.url)
+        response.status_code = 200 if html is not None else 404
+        response._content = (html or "").encode("utf-8")
+        response.encoding = "utf-8"
+        return response
+
+    def close(self):
+        pass
+
+
+@contextlib.contextmanager
+def replay_marktplaats(fixtures: List[Fixture]) -> Iterator[None]:
+    """Makes MarktplaatsClient search and fetch detail pages from `fixtures` instead of the network."""
+    pages = {f["link"]: f["detail_html"] for f in fixtures}
+
+    class FakeSearchQuery:
+        def __init__(self, limit: int, **_):
+            self._limit = limit
+
+        def get_listings(self):
+            return [_FakeSearchResult(f) for f in fixtures[:self._limit]]
+
+    with mock.patch.object(marktplaats_client, "SearchQuery", FakeSearchQuery), \
+            mock.patch.object(marktplaats_client, "category_from_name", lambda name: name), \
+            mock.patch.object(marktplaats_client, "HTTPAdapter", lambda **kw: _FixtureAdapter(pages, **kw)):
+        yield
@@ -0,0 +1,69 @@
+# benchmarks/fixtures.py
+import html
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from evaluation.cases import TEST_CASES
+
+# A fixture is one recorded listing: the search result fields, the detail page
+# HTML, the OCR text per image URL and the extraction LLM response.
+Fixture = Dict[str, Any]
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")[:40]
+
+
+def _detail_page(images: List[str], description: str) -> str:
+    """Renders a minimal Marktplaats detail page in the shape MarktplaatsClient parses."""
+    product = {"@type": "Product", "image": [url.removeprefix("https:") for url in images]}
+    body = "<br>".join(html.escape(line) for line in description.split("\n"))
+    return (
+        "<html><head>"
+        f'<script type="application/ld+json">{json.dumps(product)}</script>'
+        "</head><body>"
+        f'<div class="Description-description">{body}</div>'
+        "</body></html>"
+    )
+
+
+def build_fixtures(count: int) -> List[Fixture]:
+    """
+    Builds `count` listing fixtures by cycling through the evaluation cases, each
+    with a unique link and image URLs. The recorded extraction response is the
+    case's expected extraction.
+    """
+    fixtures = []
+    now = datetime.now(timezone.utc)
+    for i in range(count):
+        case = TEST_CASES[i % len(TEST_CASES)]
+        link = f"https://www.marktplaats.nl/v/spelcomputers-en-games/bordspellen/m{2_000_000 + i}-{_slug(case.title)}"
+        images = [f"https://images.marktplaats.com/benchmark/{i}/{j}.jpg" for j in range(len(case.image_texts))]
+        fixtures.append({
+            "link": link,
+            "title": case.title,
+            "description": case.description,
+            "price": float(5 + i % 40),
+            "price_type": "FIXED",
+            "city": "Utrecht",
+            "distance_m": 1000 * (i % 50),
+            "date": (now - timedelta(minutes=i)).isoformat(),
+            "images": images,
+            "detail_html": _detail_page(images, case.description),
+            "ocr_texts": dict(zip(images, case.image_texts)),
+            "extraction_response": json.dumps(case.expected_extraction, ensure_ascii=False),
+        })
+    return fixtures
+
+
+def save_fixtures(path: str, fixtures: List[Fixture]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(fixtures, f, ensure_ascii=False, indent=1)
+
+
+def load_fixtures(path: str) -> List[Fixture]:
+    """Loads fixtures saved with `save_fixtures`, e.g. recorded from real listings."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,160 @@
+# benchmarks/matcher_scaling.py
+"""
+Matcher scaling study.
+
+Builds synthetic BGG catalogues of increasing size and, for every matcher and
+name index scorer, measures construction time, memory and per-query latency of
+candidate generation for query sets taken from the evaluation cases. The LLM is
+a stub, so only the local work is measured.
+
+Run with `PYTHONPATH=src:. python -m benchmarks.matcher_scaling --sizes 10000 100000`.
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from boardgamefinder.instrumentation import percentile
+from boardgamefinder.services.matcher import FuzzyNameMatcher, LLMNameMatcher, NameMatcher
+from boardgamefinder.services.name_index import rapidfuzz_available
+from evaluation.cases import TEST_CASES
+
+from .catalogue import synthetic_catalogue
+from .fakes import DataFrameBGGRepository, ReplayLLM
+from .measure import measure, silenced
+
+DEFAULT_SIZES = [10_000, 50_000, 100_000, 500_000]
+
+
+def query_sets() -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Returns the (name, language) query sets: the names the extractor is expected
+    to produce, the exact BGG names they should match, and the raw listing titles.
+    """
+    extracted = [(i["llm_name"], i["llm_lang"]) for case in TEST_CASES for i in case.expected_extraction]
+    bgg_names = [
+        (m["name"], "en") for case in TEST_CASES for m in case.expected_matches if m.get("name")
+    ]
+    titles = [(case.title, "unknown") for case in TEST_CASES]
+    return {"extracted": extracted, "bgg_names": bgg_names, "titles": titles}
+
+
+# Matcher name -> (factory, per-query function); the query function is what gets timed
+_MATCHERS: Dict[str, Tuple[Callable[..., NameMatcher], Callable[[Any, str, str], Any]]] = {
+    "fuzzy": (
+        lambda repo, scorer: FuzzyNameMatcher(repository=repo, scorer=scorer),
+        lambda matcher, name, lang: matcher.match(name, lang),
+    ),
+    "llm": (
+        lambda repo, scorer: LLMNameMatcher(repository=repo, llm_client=ReplayLLM([]), scorer=scorer),
+        lambda matcher, name, lang: matcher._get_candidates(name),
+    ),
+}
+
+
+def run_study(
+    sizes: List[int],
+    matchers: List[str],
+    scorers: List[str],
+    memory: bool = True,
+    quiet: bool = True,
+) -> List[Dict[str, Any]]:
+    """Returns one result row per catalogue size, matcher and scorer."""
+    queries = query_sets()
+    rows = []
+    for size in sizes:
+        start = time.perf_counter()
+        repo = DataFrameBGGRepository(synthetic_catalogue(size))
+        print(f"Generated a catalogue of {size} names in {time.perf_counter() - start:.1f}s")
+
+        for matcher_name in matchers:
+            factory, query = _MATCHERS[matcher_name]
+            for scorer in scorers:
+                init = measure(
+                    "init", 1, lambda: lambda: factory(repo, scorer), quiet=quiet, memory=memory
+                )
+                with silenced(quiet):
+                    matcher = factory(repo, scorer)
+
+                row = {
+                    "size": size,
+                    "matcher": matcher_name,
+                    "scorer": scorer,
+                    "init_s": init["wall_s"],
+                    "retained_mb": init["retained_mb"],
+                    "peak_mb": init["peak_mb"],
+                    "queries": {},
+                }
+                for set_name, pairs in queries.items():
+                    # Timed here rather than with spans, whose summary only has 0.1ms resolution
+                    latencies: List[float] = []
+
+                    def run_queries(pairs=pairs):
+                        latencies.clear()
+                        for name, lang in pairs:
+                            start = time.perf_counter()
+                            query(matcher, name, lang)
+                            latencies.append(time.perf_counter() - start)
+
+                    result = measure(set_name, len(pairs), lambda: run_queries, quiet=quiet, memory=False)
+                    latencies.sort()
+                    row["queries"][set_name] = {
+                        "count": len(latencies),
+                        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+                        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+                        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+                        "qps": result["items_per_s"],
+                    }
+                rows.append(row)
+                print(f"  {matcher_name}/{scorer}: init {row['init_s']:.2f}s")
+                del matcher
+    return rows
+
+
+def print_table(rows: List[Dict[str, Any]], latency_budget_ms: float) -> None:
+    """Prints one line per row, flagging rows whose p95 latency exceeds the budget."""
+    set_names = list(rows[0]["queries"]) if rows else []
+    header = f"{'size':>8} {'matcher':<7} {'scorer':<9} {'init s':>7} {'mem MB':>7} {'peak MB':>8}"
+    for set_name in set_names:
+        header += f" {set_name + ' p50/p95 ms':>26}"
+    print("\n" + header + "  budget")
+    for row in rows:
+        line = (
+            f"{row['size']:>8} {row['matcher']:<7} {row['scorer']:<9} {row['init_s']:>7.2f} "
+            f"{row['retained_mb'] if row['retained_mb'] is not None else '-':>7} "
+            f"{row['peak_mb'] if row['peak_mb'] is not None else '-':>8}"
+        )
+        worst = 0.0
+        for set_name in set_names:
+            q = row["queries"][set_name]
+            line += f" {q['p50_ms']:>12.3f} /{q['p95_ms']:>11.3f}"
+            worst = max(worst, q["p95_ms"])
+        print(line + ("  ok" if worst <= latency_budget_ms else "  OVER"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how the name matchers scale with the catalogue size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Catalogue sizes to test.")
+    parser.add_argument("--matchers", nargs="+", choices=sorted(_MATCHERS), default=sorted(_MATCHERS))
+    parser.add_argument(
+        "--scorers", nargs="+", choices=["trigram", "rapidfuzz"],
+        default=["trigram", "rapidfuzz"] if rapidfuzz_available() else ["trigram"],
+    )
+    parser.add_argument("--latency-budget-ms", type=float, default=50.0, help="p95 query latency considered acceptable.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the (slow) tracemalloc pass.")
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--verbose", action="store_true", help="Show the matchers' own output.")
+    args = parser.parse_args()
+
+    rows = run_study(
+        sorted(args.sizes), args.matchers, args.scorers, memory=not args.no_memory, quiet=not args.verbose
+    )
+    print_table(rows, args.latency_budget_ms)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
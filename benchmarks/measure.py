@@ -0,0 +1,65 @@
+# benchmarks/measure.py
+import contextlib
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator
+
+from boardgamefinder import instrumentation
+
+
+@contextlib.contextmanager
+def silenced(quiet: bool = True) -> Iterator[None]:
+    """Discards everything printed inside the block when `quiet` is set."""
+    if not quiet:
+        yield
+        return
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure(
+    name: str,
+    items: int,
+    setup: Callable[[], Callable[[], Any]],
+    quiet: bool = True,
+    memory: bool = True,
+) -> Dict[str, Any]:
+    """
+    Runs the callable returned by `setup` and returns its wall time, throughput
+    and the stage timings recorded by `boardgamefinder.instrumentation`.
+
+    With `memory`, it is set up and run once more under tracemalloc, since tracing
+    allocations slows everything down, to report the peak memory during the run
+    and the memory still held by its return value. `setup` is never measured.
+    """
+    with silenced(quiet):
+        run = setup()
+    instrumentation.reset()
+    start = time.perf_counter()
+    with silenced(quiet):
+        run()
+    elapsed = time.perf_counter() - start
+    result = {
+        "name": name,
+        "items": items,
+        "wall_s": round(elapsed, 3),
+        "items_per_s": round(items / elapsed, 1) if elapsed > 0 else None,
+        "peak_mb": None,
+        "retained_mb": None,
+        **instrumentation.summary(),
+    }
+
+    if memory:
+        with silenced(quiet):
+            run = setup()
+            tracemalloc.start()
+            try:
+                kept = run()
+                retained, peak = tracemalloc.get_traced_memory()
+                del kept
+            finally:
+                tracemalloc.stop()
+        result["peak_mb"] = round(peak / 2**20, 1)
+        result["retained_mb"] = round(retained / 2**20, 1)
+    return result
@@ -0,0 +1,208 @@
+# benchmarks/run_benchmarks.py
+"""
+Offline end-to-end benchmarks.
+
+Replays recorded listing fixtures (Marktplaats search results and detail pages,
+OCR texts and extraction LLM responses) through the real pipeline code, with
+in-memory fakes for Firestore, Google Vision and the LLM, and a local BGG CSV.
+Reports throughput, per-stage latency and peak Python memory for:
+
+- run_pipeline (scrape -> enrich -> save)
+- ListingEnricher.enrich
+- FuzzyNameMatcher and LLMNameMatcher
+- WebGenerator.generate_site
+
+Run with `PYTHONPATH=src:. python -m benchmarks.run_benchmarks`.
+"""
+import argparse
+import contextlib
+import json
+import os
+import tempfile
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from boardgamefinder.adapters.bgg_repository import BGGFileRepository
+from boardgamefinder.config import settings
+from boardgamefinder.domain.models import Listing
+from boardgamefinder.pipeline.enrich_listing import ListingEnricher
+from boardgamefinder.pipeline.run_pipeline import run_pipeline
+from boardgamefinder.services.extractor import JsonNameExtractor
+from boardgamefinder.services.matcher import FuzzyNameMatcher, LLMNameMatcher
+from boardgamefinder.web.generator import WebGenerator
+
+from .catalogue import synthetic_catalogue
+from .fakes import FakeListingRepository, FakeOcrClient, ReplayLLM, replay_marktplaats
+from .fixtures import Fixture, build_fixtures, load_fixtures, save_fixtures
+from .measure import measure, silenced
+
+
+@contextlib.contextmanager
+def _override_settings(**values: Any) -> Iterator[None]:
+    """Temporarily replaces attributes of the global settings object."""
+    previous = {name: getattr(settings, name) for name in values}
+    for name, value in values.items():
+        setattr(settings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+
+
+def _listing_from_fixture(fixture: Fixture) -> Listing:
+    return Listing(
+        title=fixture["title"],
+        description=fixture["description"],
+        price=fixture["price"],
+        price_type=fixture["price_type"],
+        link=fixture["link"],
+        city=fixture["city"],
+        distance_km=fixture["distance_m"] // 1000,
+        date=fixture["date"],
+        images=fixture["images"],
+    )
+
+
+def _names_to_match(fixtures: List[Fixture]) -> List[Tuple[str, str]]:
+    """Returns every (name, language) pair the extraction responses produce."""
+    return [
+        (item["llm_name"], item["llm_lang"])
+        for f in fixtures
+        for item in json.loads(f["extraction_response"])
+    ]
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    print(f"\n{'benchmark':<24} {'items':>7} {'wall s':>9} {'items/s':>10} {'peak MB':>9}")
+    for r in results:
+        print(f"{r['name']:<24} {r['items']:>7} {r['wall_s']:>9.3f} {r['items_per_s'] or 0:>10.1f} {r['peak_mb'] or 0:>9.1f}")
+        for stage, stats in r["stages"].items():
+            print(
+                f"    {stage:<30} n={stats['count']:<6} p50={stats['p50_s'] * 1000:8.2f}ms "
+                f"p95={stats['p95_s'] * 1000:8.2f}ms total={stats['total_s']:.3f}s"
+            )
+
+
+def run_benchmarks(
+    fixtures: List[Fixture],
+    bgg_csv: str,
+    llm_latency: float = 0.0,
+    workers: Optional[int] = None,
+    quiet: bool = True,
+) -> List[Dict[str, Any]]:
+    """Runs every benchmark against `fixtures` and the BGG data in `bgg_csv`."""
+    results = []
+    bgg_repo = BGGFileRepository(bgg_csv)
+    llm = ReplayLLM(fixtures, latency=llm_latency)
+    ocr_client = FakeOcrClient(fixtures)
+
+    def make_enricher() -> ListingEnricher:
+        matcher = LLMNameMatcher(
+            repository=bgg_repo,
+            llm_client=llm,
+            fast_path=settings.matcher_fast_path,
+            fast_path_min_score=settings.matcher_fast_path_min_score,
+            fast_path_min_margin=settings.matcher_fast_path_min_margin,
+        )
+        return ListingEnricher(
+            ocr_client=ocr_client,
+            extractor=JsonNameExtractor(client=llm),
+            matcher=matcher,
+            ocr_concurrency=settings.pipeline_ocr_concurrency,
+            extraction_concurrency=settings.pipeline_extraction_concurrency,
+            matching_concurrency=settings.pipeline_matching_concurrency,
+        )
+
+    with silenced(quiet):
+        bgg_repo.get_all_games()  # Load the CSV once, outside of any measurement
+        pipeline_enricher = make_enricher()
+        enricher = make_enricher()
+
+    # 1. The full pipeline, from the (replayed) search to the batched save, into an empty repository
+    repos: List[FakeListingRepository] = []
+
+    def setup_pipeline() -> Callable[[], Any]:
+        repos.append(FakeListingRepository())
+        return lambda: run_pipeline(enricher=pipeline_enricher, repo=repos[-1], workers=workers)
+
+    with replay_marktplaats(fixtures), _override_settings(
+        max_listings=len(fixtures), marktplaats_requests_per_second=0.0
+    ):
+        results.append(measure("run_pipeline", len(fixtures), setup_pipeline, quiet))
+
+    # 2. Enrichment of each listing on its own, sequentially
+    def setup_enrich() -> Callable[[], Any]:
+        listings = [_listing_from_fixture(f) for f in fixtures]
+        return lambda: [enricher.enrich(l) for l in listings]
+
+    results.append(measure("enrich", len(fixtures), setup_enrich, quiet))
+
+    # 3. Both matchers: their construction (index build), then every extracted name
+    names = _names_to_match(fixtures)
+    for label, factory in (
+        ("fuzzy", lambda: FuzzyNameMatcher(repository=bgg_repo)),
+        ("llm", lambda: LLMNameMatcher(repository=bgg_repo, llm_client=llm)),
+    ):
+        results.append(measure(f"matcher.{label}.init", 1, lambda: factory, quiet))
+        with silenced(quiet):
+            matcher = factory()
+        results.append(measure(
+            f"matcher.{label}", len(names),
+            lambda: lambda: [matcher.match(name, lang) for name, lang in names],
+            quiet,
+        ))
+
+    # 4. A full site build from the listings the pipeline saved
+    repo = repos[-1]
+    with tempfile.TemporaryDirectory() as out_dir, _override_settings(
+        web_output_dir=out_dir, web_state_path=os.path.join(out_dir, "site_state.json")
+    ):
+        with silenced(quiet):
+            generator = WebGenerator(repo)
+        results.append(measure(
+            "generate_site", len(repo), lambda: lambda: generator.generate_site(incremental=False), quiet
+        ))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline pipeline benchmarks.")
+    parser.add_argument("--listings", type=int, default=200, help="Number of generated listing fixtures.")
+    parser.add_argument("--fixtures", help="Load listing fixtures from this JSON file instead of generating them.")
+    parser.add_argument("--save-fixtures", help="Write the generated fixtures to this JSON file.")
+    parser.add_argument("--bgg-csv", help="BGG CSV to match against (default: a synthetic catalogue).")
+    parser.add_argument("--catalogue-size", type=int, default=20000, help="Size of the synthetic catalogue.")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated latency per LLM call.")
+    parser.add_argument("--workers", type=int, help="Pipeline workers (default: settings.pipeline_workers).")
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--verbose", action="store_true", help="Show the pipeline's own output.")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures) if args.fixtures else build_fixtures(args.listings)
+    if args.save_fixtures:
+        save_fixtures(args.save_fixtures, fixtures)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bgg_csv = args.bgg_csv
+        if not bgg_csv:
+            bgg_csv = os.path.join(tmp, "bgg.csv")
+            synthetic_catalogue(args.catalogue_size).to_csv(bgg_csv, index=False)
+        print(f"Benchmarking {len(fixtures)} listings against {bgg_csv}...")
+        results = run_benchmarks(
+            fixtures,
+            bgg_csv,
+            llm_latency=args.llm_latency_ms / 1000,
+            workers=args.workers,
+            quiet=not args.verbose,
+        )
+
+    _print_table(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,17 @@
 import sys
 import os
 import re
+from typing import Any, Dict
 
 # Add src to path to allow imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from evaluation.cases import TEST_CASES
+from evaluation.cases import TEST_CASES, PromptTestCase
 from boardgamefinder.services.extractor import JsonNameExtractor
-from boardgamefinder.adapters.llm_client import get_llm_client
+from boardgamefinder.adapters.llm_client import CachingLLM, get_llm_client
+
+
+_EMOJI = {"Pass": "✅", "Uncertain": "⚠️", "Fail": "❌"}
 
 
 def normalize_name(s: str) -> str:
@@ -20,6 +24,38 @@ def normalize_name(s: str) -> str:
     return s.strip()
 
 
+def evaluate_case(extractor: JsonNameExtractor, case: PromptTestCase) -> Dict[str, Any]:
+    """
+    Runs the extractor on one test case. The status is "Pass" when the same
+    names are extracted with the same languages, "Uncertain" when only the
+    languages differ, and "Fail" otherwise.
+    """
+    actual_items = extractor.extract(case.title, case.description, case.image_texts)
+
+    # Normalize names for comparison
+    actual_map = {normalize_name(i["llm_name"]): i for i in actual_items}
+    expected_map = {normalize_name(i["llm_name"]): i for i in case.expected_extraction}
+
+    actual_names = set(actual_map.keys())
+    expected_names = set(expected_map.keys())
+
+    # Determine test status
+    if actual_names != expected_names:
+        status = "Fail"
+    elif all(actual_map[n]["llm_lang"] == expected_map[n]["llm_lang"] for n in expected_map):
+        status = "Pass"
+    else:
+        status = "Uncertain"
+
+    return {
+        "status": status,
+        "expected": case.expected_extraction,
+        "actual": actual_items,
+        "expected_names": sorted(expected_names),
+        "actual_names": sorted(actual_names),
+    }
+
+
 def main():
     """Evaluates the JsonNameExtractor against predefined test cases."""
     print("Initializing components for extractor evaluation...")
@@ -40,41 +76,19 @@ def main():
         print(f"\n[TEST CASE]: {case.name}")
 
         try:
-            actual_items = extractor.extract(case.title, case.description, case.image_texts)
-
-            # Normalize names for comparison
-            actual_map = {normalize_name(i["llm_name"]): i for i in actual_items}
-            expected_map = {normalize_name(i["llm_name"]): i for i in case.expected_extraction}
-
-            actual_names = set(actual_map.keys())
-            expected_names = set(expected_map.keys())
-
-            # Determine test status
-            if actual_names != expected_names:
-                result_label = "Fail"
-                emoji = "❌"
-            else:
-                all_langs_match = all(
-                    actual_map[n]["llm_lang"] == expected_map[n]["llm_lang"]
-                    for n in expected_map
-                )
-                if all_langs_match:
-                    result_label = "Pass"
-                    emoji = "✅"
-                else:
-                    result_label = "Uncertain"
-                    emoji = "⚠️"
-
+            result = evaluate_case(extractor, case)
+            result_label = result["status"]
+            emoji = _EMOJI[result_label]
             results[result_label] += 1
 
             # Print details
             print(f"  - Status:     {emoji} {result_label}")
-            print(f"  - Expected:   {case.expected_extraction}")
-            print(f"  - Actual:     {actual_items}")
+            print(f"  - Expected:   {result['expected']}")
+            print(f"  - Actual:     {result['actual']}")
 
             if result_label == "Fail":
-                print(f"  - Normalized Expected Names: {sorted(expected_names)}")
-                print(f"  - Normalized Actual Names:   {sorted(actual_names)}")
+                print(f"  - Normalized Expected Names: {result['expected_names']}")
+                print(f"  - Normalized Actual Names:   {result['actual_names']}")
 
         except Exception as e:
             print(f"  - ERROR processing case: {e}")
@@ -86,6 +100,8 @@ def main():
     for label, count in results.items():
         pct = (count / total * 100) if total > 0 else 0
         print(f"{label}: {count}/{total} ({pct:.2f}%)")
+    if isinstance(llm_client, CachingLLM):
+        print(f"LLM cache stats: {llm_client.cache.stats()}")
 
 
 if __name__ == "__main__":
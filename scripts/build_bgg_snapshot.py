@@ -0,0 +1,54 @@
+# scripts/build_bgg_snapshot.py
+import argparse
+
+from boardgamefinder.config import settings
+from boardgamefinder.adapters.bgg_repository import (
+    NORM_NAME_COL,
+    BGGFileRepository,
+    get_bgg_repository,
+    write_bgg_snapshot,
+)
+from boardgamefinder.services.matcher import _normalize_name
+from boardgamefinder.services.name_index import TrigramIndex
+
+
+def main():
+    """
+    Converts the BGG games CSV into a columnar snapshot with precomputed
+    normalized names and trigram name index, for use with BGG_REPOSITORY_TYPE="snapshot"
+    (the index is only reused with MATCHER_SCORER="trigram").
+    """
+    parser = argparse.ArgumentParser(description="Build a columnar BGG snapshot for fast matcher startup.")
+    parser.add_argument(
+        "--csv",
+        help="Path to a local games.csv. Defaults to the configured BGG repository (file or gcs).",
+    )
+    parser.add_argument(
+        "--output",
+        default=settings.bgg_snapshot_path,
+        help=f"Snapshot directory to write (default: {settings.bgg_snapshot_path}).",
+    )
+    args = parser.parse_args()
+
+    if args.csv:
+        source = BGGFileRepository(path=args.csv)
+    elif settings.bgg_repository_type == "snapshot":
+        parser.error("BGG_REPOSITORY_TYPE is 'snapshot'; pass --csv to choose the source CSV.")
+    else:
+        source = get_bgg_repository()
+
+    df = source.get_all_games()
+    df = df[df["Name"].notna()].reset_index(drop=True)
+    print(f"Normalizing {len(df)} names...")
+    df[NORM_NAME_COL] = [_normalize_name(n) for n in df["Name"].astype(str)]
+
+    print("Building name index...")
+    unique_names = list(dict.fromkeys(df[NORM_NAME_COL]))
+    index = TrigramIndex(unique_names)
+
+    write_bgg_snapshot(args.output, df, index.to_arrays())
+    print(f"Snapshot with {len(df)} games and {len(unique_names)} unique names written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
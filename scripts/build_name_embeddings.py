@@ -0,0 +1,51 @@
+# scripts/build_name_embeddings.py
+import argparse
+
+from boardgamefinder.config import settings
+from boardgamefinder.adapters.bgg_repository import BGGFileRepository, get_bgg_repository
+from boardgamefinder.services.embedding_retriever import (
+    load_sentence_transformer,
+    write_name_embeddings,
+)
+from boardgamefinder.services.matcher import _normalize_name
+
+
+def main():
+    """
+    Encodes every normalized BGG name with a local sentence-transformers model and
+    writes the embedding matrix (plus an HNSW index if hnswlib is installed) for
+    the LLM matcher's embedding candidates (MATCHER_EMBEDDINGS_PATH).
+    """
+    parser = argparse.ArgumentParser(description="Build BGG name embeddings for candidate retrieval.")
+    parser.add_argument(
+        "--csv",
+        help="Path to a local games.csv. Defaults to the configured BGG repository.",
+    )
+    parser.add_argument(
+        "--model",
+        default=settings.matcher_embedding_model_path,
+        help="Local sentence-transformers model directory (default: MATCHER_EMBEDDING_MODEL_PATH).",
+    )
+    parser.add_argument(
+        "--output",
+        default=settings.matcher_embeddings_path or "bgg_data/name_embeddings",
+        help="Output directory (default: MATCHER_EMBEDDINGS_PATH or bgg_data/name_embeddings).",
+    )
+    parser.add_argument("--no-ann", action="store_true", help="Skip building the HNSW index.")
+    args = parser.parse_args()
+
+    if not args.model:
+        parser.error("Pass --model or set MATCHER_EMBEDDING_MODEL_PATH.")
+
+    source = BGGFileRepository(path=args.csv) if args.csv else get_bgg_repository()
+    df = source.get_all_games()
+    names = list(dict.fromkeys(_normalize_name(n) for n in df["Name"].dropna().astype(str)))
+
+    print(f"Encoding {len(names)} unique names with {args.model}...")
+    encoder = load_sentence_transformer(args.model)
+    write_name_embeddings(args.output, names, encoder, model_path=args.model, build_ann=not args.no_ann)
+    print(f"Name embeddings written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
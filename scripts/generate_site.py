@@ -1,12 +1,22 @@
 # scripts/generate_site.py
+import argparse
+
 from boardgamefinder.adapters.firestore_repository import get_listing_repository
 from boardgamefinder.web.generator import WebGenerator
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate the static website from Firestore data.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild from the whole collection instead of applying changes since the last build."
+    )
+    args = parser.parse_args()
+
     repo = get_listing_repository()
     generator = WebGenerator(repo)
-    generator.generate_site()
+    generator.generate_site(incremental=not args.full)
 
 
 if __name__ == "__main__":
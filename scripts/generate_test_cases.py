@@ -1,6 +1,5 @@
 # scripts/generate_test_cases.py
 import textwrap
-from datetime import timezone
 
 from evaluation.cases import TEST_CASES
 from boardgamefinder.adapters.firestore_repository import get_listing_repository, ListingRepository
@@ -102,21 +101,8 @@ def main():
             existing_cases = {(case.title, case.description) for case in TEST_CASES}
             log_print(f"Found {len(existing_cases)} existing test cases to check against.")
 
-            log_print("Fetching all listings from Firestore...")
-            all_listings = repo.get_all()
-            log_print(f"Found {len(all_listings)} total listings.")
-
-            if not all_listings:
-                log_print("No listings found. Exiting.")
-                return
-
-            # Standardize all datetimes to be timezone-aware (UTC) to prevent comparison errors.
-            def make_aware(dt):
-                if dt.tzinfo is None:
-                    return dt.replace(tzinfo=timezone.utc)
-                return dt.astimezone(timezone.utc)
-
-            sorted_listings = sorted(all_listings, key=lambda l: make_aware(l.created_at))
+            log_print("Streaming all listings from Firestore, oldest first...")
+            sorted_listings = repo.iter_created_since()
 
             log_print("\n" + "="*80)
             log_print("Generated New Test Cases (copy and paste into the TEST_CASES list in evaluation/cases.py)")
@@ -124,7 +110,9 @@ def main():
 
             new_cases_code = []
             skipped_count = 0
+            total_count = 0
             for listing in sorted_listings:
+                total_count += 1
                 # Check if a case with the exact same title and description already exists
                 if (listing.title, listing.description) in existing_cases:
                     skipped_count += 1
@@ -135,6 +123,7 @@ def main():
                     case_code = generate_test_case_code(listing, repo)
                     new_cases_code.append(case_code)
             
+            log_print(f"Found {total_count} total listings.")
             log_print(f"Skipped {skipped_count} listings with a matching title and description in cases.py.")
             log_print(f"Generating {len(new_cases_code)} new test cases.\n")
 
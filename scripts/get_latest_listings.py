@@ -1,4 +1,5 @@
 # scripts/get_latest_listings.py
+import argparse
 from datetime import timezone
 from boardgamefinder.adapters.firestore_repository import get_listing_repository
 from boardgamefinder.domain.models import Listing # Import Listing for type hints
@@ -55,9 +56,18 @@ def format_listing_details(listing: Listing):
 
 def main():
     """
-    Fetches all listings from Firestore, sorts them by creation time,
-    and prints the latest listings in a simple format with BGG details.
+    Fetches the most recently created listings from Firestore and prints them
+    in a simple format with BGG details.
     """
+    parser = argparse.ArgumentParser(description="Print the latest listings with their BGG matches.")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=50,
+        help="Number of listings to show (default: 50)."
+    )
+    args = parser.parse_args()
+
     print("Initializing Firestore repository...")
     try:
         repo = get_listing_repository()
@@ -66,21 +76,15 @@ def main():
         print("Please ensure your GCP credentials are set up correctly.")
         return
 
-    print("Fetching all listings...")
-    all_listings = repo.get_all()
-    print(f"Found {len(all_listings)} total listings.")
+    print(f"Fetching the {args.limit} latest listings...")
+    # Ordered by 'created_at' in descending order (latest first) by Firestore
+    sorted_listings = repo.latest(args.limit)
+    print(f"Found {len(sorted_listings)} listings.")
 
-    if not all_listings:
+    if not sorted_listings:
         print("No listings found. Exiting.")
         return
 
-    # Sort listings by the 'created_at' attribute in descending order (latest first)
-    sorted_listings = sorted(
-        all_listings,
-        key=lambda l: make_aware(l.created_at), 
-        reverse=True
-    )
-
     print("\n--- Latest Listings ---")
     
     # Define a wide header for the new columns
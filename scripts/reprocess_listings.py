@@ -0,0 +1,43 @@
+# scripts/reprocess_listings.py
+import argparse
+from boardgamefinder.adapters.firestore_repository import get_listing_repository
+from boardgamefinder.adapters.bgg_repository import get_bgg_repository
+from boardgamefinder.adapters.llm_client import CachingLLM, get_llm_client
+from boardgamefinder.pipeline.reprocess import add_reprocess_arguments, run_reprocessing
+from boardgamefinder.services.extractor import JsonNameExtractor
+from boardgamefinder.services.matcher import get_name_matcher
+
+def main():
+    """
+    Reruns LLM extraction and/or BGG name matching over all listings in Firestore,
+    with parallel workers, batched writes and a resumable checkpoint. Large
+    backfills can be split over several processes with --shard/--num-shards, e.g.
+
+        for i in 0 1 2 3; do python scripts/reprocess_listings.py --mode both --shard $i --num-shards 4 & done
+    """
+    parser = argparse.ArgumentParser(description="Reprocess stored listings after prompt or data changes.")
+    parser.add_argument(
+        "--mode",
+        choices=["extract", "match", "both"],
+        default="both",
+        help="Rerun extraction, matching, or extraction followed by matching (default: both).",
+    )
+    add_reprocess_arguments(parser)
+    args = parser.parse_args()
+
+    print("Initializing components...")
+    repo = get_listing_repository()
+    llm_client = get_llm_client()
+    extractor = JsonNameExtractor(client=llm_client) if args.mode in ("extract", "both") else None
+    matcher = None
+    if args.mode in ("match", "both"):
+        matcher = get_name_matcher(repository=get_bgg_repository(), llm_client=llm_client)
+
+    run_reprocessing(args, repo, mode=args.mode, extractor=extractor, matcher=matcher)
+    if matcher is not None:
+        print(f"Matcher decisions: {dict(matcher.stats)}, memo: {matcher.memo_stats()}")
+    if isinstance(llm_client, CachingLLM):
+        print(f"LLM cache stats: {llm_client.cache.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
 # src/boardgamefinder/adapters/bgg_repository.py
+import hashlib
+import json
+import os
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 from io import BytesIO
 from google.cloud import storage
@@ -9,12 +14,30 @@ from ..config import settings
 
 COLS = ["BGGId", "Name", "YearPublished", "GameWeight", "AvgRating", "ImagePath"]
 
+# Extra column written to snapshots: the matcher's normalized form of "Name"
+NORM_NAME_COL = "NormName"
+_SNAPSHOT_MANIFEST = "manifest.json"
+_SNAPSHOT_VERSION = 1
+_INDEX_PREFIX = "index_"
+
 class BGGRepository(ABC):
     """Abstract interface for a repository of BoardGameGeek game data."""
     @abstractmethod
     def get_all_games(self) -> pd.DataFrame:
         ...
 
+    def get_name_index_arrays(self) -> Optional[Dict[str, np.ndarray]]:
+        """Returns a precomputed name index (see `TrigramIndex.to_arrays`), if available."""
+        return None
+
+    def get_version(self) -> str:
+        """
+        Returns a string that changes whenever the game data changes, e.g. to
+        invalidate cached match results. Defaults to a hash of the data itself.
+        """
+        hashes = pd.util.hash_pandas_object(self.get_all_games()[COLS], index=False)
+        return "sha256:" + hashlib.sha256(hashes.to_numpy().tobytes()).hexdigest()
+
 class BGGFileRepository(BGGRepository):
     """Loads BGG data from a local CSV file."""
     def __init__(self, path: str):
@@ -31,26 +54,148 @@ class BGGFileRepository(BGGRepository):
             print("BGG data loaded successfully.")
         return self._df
 
+    def get_version(self) -> str:
+        stat = os.stat(self._path)
+        return f"file:{os.path.abspath(self._path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
 class BGGGCSRepository(BGGRepository):
-    """Loads BGG data from a CSV file in a Google Cloud Storage bucket."""
-    def __init__(self, bucket_name: str, file_path: str):
+    """
+    Loads BGG data from a CSV file in a Google Cloud Storage bucket.
+
+    With a `cache_dir`, the CSV is kept on local disk keyed by the blob's
+    generation: only the object's metadata is fetched when it has not changed,
+    and a new generation is streamed straight to disk.
+    """
+    def __init__(self, bucket_name: str, file_path: str, cache_dir: Optional[str] = None):
         self._bucket_name = bucket_name
         self._file_path = file_path
+        self._cache_dir = cache_dir
         self._df: Optional[pd.DataFrame] = None
+        self._generation: Optional[int] = None
         self._storage_client = storage.Client()
         print(f"Initializing BGGGCSRepository with gs://{bucket_name}/{file_path}")
 
+    def _cached_csv_path(self, blob: storage.Blob) -> str:
+        """Returns a local copy of `blob`, downloading it only if this generation is not cached yet."""
+        prefix = f"{self._bucket_name}-{self._file_path}".replace("/", "_") + "-"
+        local_path = os.path.join(self._cache_dir, f"{prefix}{blob.generation}.csv")
+        if os.path.exists(local_path):
+            print(f"Using cached BGG data for generation {blob.generation}: {local_path}")
+            return local_path
+
+        os.makedirs(self._cache_dir, exist_ok=True)
+        tmp_path = local_path + ".part"
+        print(f"Downloading generation {blob.generation} to {local_path}...")
+        blob.download_to_filename(tmp_path, if_generation_match=blob.generation)
+        os.replace(tmp_path, local_path)
+
+        # Drop copies of older generations
+        for name in os.listdir(self._cache_dir):
+            old_path = os.path.join(self._cache_dir, name)
+            if name.startswith(prefix) and old_path != local_path:
+                os.remove(old_path)
+        return local_path
+
     def get_all_games(self) -> pd.DataFrame:
         if self._df is None:
             print(f"Loading BGG data from GCS: gs://{self._bucket_name}/{self._file_path}...")
             bucket = self._storage_client.bucket(self._bucket_name)
-            blob = bucket.blob(self._file_path)
-            
-            data = blob.download_as_bytes()
-            self._df = pd.read_csv(BytesIO(data))[COLS]
+
+            if self._cache_dir:
+                # A single metadata request tells us whether the cached copy is current
+                blob = bucket.get_blob(self._file_path)
+                if blob is None:
+                    raise FileNotFoundError(f"gs://{self._bucket_name}/{self._file_path} does not exist")
+                self._df = pd.read_csv(self._cached_csv_path(blob), usecols=COLS)[COLS]
+                self._generation = blob.generation
+            else:
+                data = bucket.blob(self._file_path).download_as_bytes()
+                self._df = pd.read_csv(BytesIO(data))[COLS]
             print("BGG data loaded successfully.")
         return self._df
 
+    def get_version(self) -> str:
+        self.get_all_games()
+        if self._generation is None:
+            return super().get_version()  # Generation is only known for the cached download
+        return f"gcs:{self._bucket_name}/{self._file_path}#{self._generation}"
+
+class BGGSnapshotRepository(BGGRepository):
+    """
+    Loads BGG data from a columnar snapshot directory written by `write_bgg_snapshot`.
+    Every column is a separate .npy file that is memory-mapped rather than parsed,
+    and the snapshot also carries normalized names and the matcher's name index.
+    That index is a `TrigramIndex`, so it is only reused with the "trigram" scorer.
+
+    Only the numeric columns and the index arrays stay memory-mapped, and so are
+    shared between processes. The string columns are copied into pandas string
+    storage on load, and NameMatcher keeps its own Python records per process.
+    """
+    def __init__(self, path: str):
+        self._path = path
+        self._df: Optional[pd.DataFrame] = None
+        self._index_arrays: Optional[Dict[str, np.ndarray]] = None
+        with open(os.path.join(path, _SNAPSHOT_MANIFEST), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("version") != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported BGG snapshot version in {path}: {self.manifest.get('version')}")
+        print(f"Initializing BGGSnapshotRepository with path: {self._path}")
+
+    def _load_array(self, name: str) -> np.ndarray:
+        return np.load(os.path.join(self._path, f"{name}.npy"), mmap_mode="r")
+
+    def get_all_games(self) -> pd.DataFrame:
+        if self._df is None:
+            print(f"Loading BGG snapshot from: {self._path}...")
+            columns = {col: self._load_array(col) for col in self.manifest["columns"]}
+            # Missing image paths are stored as empty strings
+            image_paths = columns["ImagePath"]
+            columns["ImagePath"] = np.where(image_paths == "", None, image_paths.astype(object))
+            # copy=False keeps the numeric columns as views of the mapped files
+            self._df = pd.DataFrame(columns, copy=False)
+            print("BGG snapshot loaded successfully.")
+        return self._df
+
+    def get_name_index_arrays(self) -> Optional[Dict[str, np.ndarray]]:
+        if self._index_arrays is None:
+            self._index_arrays = {
+                name: self._load_array(_INDEX_PREFIX + name) for name in self.manifest["index_arrays"]
+            }
+        return self._index_arrays
+
+    def get_version(self) -> str:
+        return f"snapshot:{self.manifest['created_at']}:{self.manifest['rows']}"
+
+def write_bgg_snapshot(path: str, df: pd.DataFrame, index_arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Writes `df` (COLS plus NORM_NAME_COL) and the name index arrays as a snapshot
+    directory readable by BGGSnapshotRepository.
+    """
+    os.makedirs(path, exist_ok=True)
+    columns = COLS + [NORM_NAME_COL]
+    for col in columns:
+        series = df[col]
+        if col in ("Name", "ImagePath", NORM_NAME_COL):
+            values = np.array(series.fillna("").astype(str).tolist(), dtype=str)
+        elif col == "BGGId":
+            values = series.to_numpy(dtype=np.int64)
+        else:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        np.save(os.path.join(path, f"{col}.npy"), values, allow_pickle=False)
+
+    for name, values in index_arrays.items():
+        np.save(os.path.join(path, f"{_INDEX_PREFIX}{name}.npy"), np.asarray(values), allow_pickle=False)
+
+    manifest = {
+        "version": _SNAPSHOT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "rows": len(df),
+        "columns": columns,
+        "index_arrays": sorted(index_arrays),
+    }
+    with open(os.path.join(path, _SNAPSHOT_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
 class DummyRepository(BGGRepository):
     """A dummy repository that returns an empty DataFrame, for testing."""
     def __init__(self):
@@ -66,9 +211,12 @@ def get_bgg_repository() -> BGGRepository:
         return BGGGCSRepository(
             bucket_name=settings.bgg_gcs_bucket_name,
             file_path=settings.bgg_gcs_file_path,
+            cache_dir=settings.bgg_cache_dir,
         )
     elif repo_type == "file":
         return BGGFileRepository(path=settings.bgg_local_file_path)
+    elif repo_type == "snapshot":
+        return BGGSnapshotRepository(path=settings.bgg_snapshot_path)
     elif repo_type == "dummy":
         return DummyRepository()
     else:
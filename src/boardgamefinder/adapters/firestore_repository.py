@@ -1,16 +1,34 @@
 # src/boardgamefinder/adapters/firestore_repository.py
 import hashlib
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Collection, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 from google.cloud import firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
+from pydantic import TypeAdapter
 
 from ..config import settings
 from ..domain.models import Listing
+from ..instrumentation import count, span
+
+# Timestamps are stored as the JSON strings produced by `Listing.model_dump(mode="json")`
+_TIMESTAMP_ADAPTER = TypeAdapter(datetime)
+
+def _to_stored_timestamp(dt: datetime) -> str:
+    """Serializes a datetime the same way listing timestamps are stored, for range queries."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return _TIMESTAMP_ADAPTER.dump_python(dt.astimezone(timezone.utc), mode="json")
+
+class ListingCursor(NamedTuple):
+    """Position after the last document of a page ordered by `created_at`."""
+    created_at: Any
+    doc_id: str
 
 class ListingRepository:
     """Manages persistence of Listing objects in Firestore."""
 
     _COLLECTION = "listings"
+    _MAX_BATCH_WRITES = 500  # Firestore limit per batched write
 
     def __init__(self, client: firestore.Client):
         self._client = client
@@ -24,18 +42,173 @@ class ListingRepository:
     def find_by_link(self, link: str) -> Optional[Listing]:
         """Finds a listing by its Marktplaats URL."""
         doc_id = self._doc_id_from_link(link)
-        snap = self._collection.document(doc_id).get()
+        with span("firestore.read"):
+            snap = self._collection.document(doc_id).get()
+        count("firestore.reads")
         return Listing.model_validate(snap.to_dict()) if snap.exists else None
 
-    def get_all(self) -> List[Listing]:
-        """Retrieves all listings from the collection."""
-        listings = []
-        for doc in self._collection.stream():
+    def find_many_by_links(self, links: Collection[str]) -> Dict[str, Listing]:
+        """
+        Finds listings for many Marktplaats URLs with a single multi-document read.
+        Returns a mapping from link to listing for the links that exist.
+        """
+        links_by_id = {self._doc_id_from_link(link): link for link in links}
+        if not links_by_id:
+            return {}
+
+        refs = [self._collection.document(doc_id) for doc_id in links_by_id]
+        found: Dict[str, Listing] = {}
+        with span("firestore.read"):
+            snaps = list(self._client.get_all(refs))
+        count("firestore.reads", len(refs))
+        for snap in snaps:
+            if not snap.exists:
+                continue
+            try:
+                found[links_by_id[snap.id]] = Listing.model_validate(snap.to_dict())
+            except Exception as e:
+                print(f"Failed to validate listing {snap.id}: {e}")
+        return found
+
+    def _stream(self, query: Any) -> List[Any]:
+        """Runs a query, recording its duration and the number of documents read."""
+        with span("firestore.query"):
+            docs = list(query.stream())
+        count("firestore.reads", len(docs))
+        return docs
+
+    def _from_docs(self, docs: Iterable[Any], raw: bool = False) -> List[Union[Listing, Dict[str, Any]]]:
+        """
+        Converts document snapshots to validated listings, or to plain dicts when
+        `raw` is set (e.g. for a field projection, which is not a complete Listing).
+        """
+        results: List[Union[Listing, Dict[str, Any]]] = []
+        for doc in docs:
+            if raw:
+                results.append(doc.to_dict())
+                continue
             try:
-                listings.append(Listing.model_validate(doc.to_dict()))
+                results.append(Listing.model_validate(doc.to_dict()))
             except Exception as e:
                 print(f"Failed to validate listing {doc.id}: {e}")
-        return listings
+        return results
+
+    def get_page(
+        self,
+        page_size: int = 500,
+        cursor: Optional[ListingCursor] = None,
+        since: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Union[Listing, Dict[str, Any]]], Optional[ListingCursor]]:
+        """
+        Retrieves one page of listings ordered by `created_at` (oldest first),
+        optionally only those created at or after `since`. Returns the page and a
+        cursor for the next page, or None when this was the last page. With
+        `fields`, only those fields are read and plain dicts are returned.
+        """
+        query = self._collection.order_by("created_at").order_by("__name__")
+        if since is not None:
+            query = query.where(filter=FieldFilter("created_at", ">=", _to_stored_timestamp(since)))
+        if fields is not None:
+            # created_at is always needed to build the next cursor
+            query = query.select(sorted(set(fields) | {"created_at"}))
+        if cursor is not None:
+            query = query.start_after([cursor.created_at, self._collection.document(cursor.doc_id)])
+
+        docs = self._stream(query.limit(page_size))
+        next_cursor = None
+        if len(docs) == page_size:
+            last = docs[-1]
+            next_cursor = ListingCursor(created_at=last.get("created_at"), doc_id=last.id)
+        return self._from_docs(docs, raw=fields is not None), next_cursor
+
+    def iter_created_since(
+        self,
+        since: Optional[datetime] = None,
+        page_size: int = 500,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Union[Listing, Dict[str, Any]]]:
+        """
+        Streams listings created at or after `since` (all listings if None), oldest
+        first, one page at a time.
+        """
+        cursor = None
+        while True:
+            page, cursor = self.get_page(page_size=page_size, cursor=cursor, since=since, fields=fields)
+            yield from page
+            if cursor is None:
+                return
+
+    def latest(
+        self, n: int, fields: Optional[Sequence[str]] = None
+    ) -> List[Union[Listing, Dict[str, Any]]]:
+        """Retrieves the `n` most recently created listings, newest first."""
+        query = self._collection.order_by("created_at", direction=firestore.Query.DESCENDING)
+        if fields is not None:
+            query = query.select(list(fields))
+        return self._from_docs(self._stream(query.limit(n)), raw=fields is not None)
+
+    def iter_pages(
+        self,
+        page_size: int = 500,
+        fields: Optional[Sequence[str]] = None,
+        validate: bool = True,
+        start_after: Optional[str] = None,
+    ) -> Iterator[Tuple[List[Union[Listing, Dict[str, Any]]], str]]:
+        """
+        Streams every listing in document ID order, one page at a time, yielding
+        each page with the ID of its last document. Passing that ID back as
+        `start_after` resumes right after the page, e.g. from a checkpoint.
+        See `iter_all` for `fields` and `validate`.
+        """
+        query = self._collection.order_by("__name__")
+        if fields is not None:
+            query = query.select(list(fields))
+        raw = fields is not None or not validate
+
+        last_ref = self._collection.document(start_after) if start_after else None
+        while True:
+            page_query = query.limit(page_size)
+            if last_ref is not None:
+                page_query = page_query.start_after([last_ref])
+            docs = self._stream(page_query)
+            if docs:
+                yield self._from_docs(docs, raw=raw), docs[-1].id
+            if len(docs) < page_size:
+                return
+            last_ref = docs[-1].reference
+
+    def iter_all(
+        self,
+        page_size: int = 500,
+        fields: Optional[Sequence[str]] = None,
+        validate: bool = True,
+    ) -> Iterator[Union[Listing, Dict[str, Any]]]:
+        """
+        Streams every listing in the collection, fetching `page_size` documents at
+        a time, so memory stays bounded by one page.
+
+        With `fields`, only those fields are read. With `fields` or
+        `validate=False`, plain dicts are yielded instead of validated listings,
+        which is much cheaper for consumers that only need a few fields.
+        """
+        for page, _ in self.iter_pages(page_size=page_size, fields=fields, validate=validate):
+            yield from page
+
+    def get_all(self) -> List[Listing]:
+        """Retrieves all listings from the collection."""
+        return list(self.iter_all())
+
+    def get_updated_since(
+        self, since: datetime, fields: Optional[Sequence[str]] = None
+    ) -> List[Union[Listing, Dict[str, Any]]]:
+        """Retrieves listings whose `updated_at` is at or after `since`."""
+        query = self._collection.where(
+            filter=FieldFilter("updated_at", ">=", _to_stored_timestamp(since))
+        )
+        if fields is not None:
+            query = query.select(list(fields))
+        return self._from_docs(self._stream(query), raw=fields is not None)
 
     def save(self, listing: Listing) -> None:
         """Saves a listing to Firestore, setting timestamps."""
@@ -44,16 +217,65 @@ class ListingRepository:
 
         # Check if the document exists to set created_at only once
         doc_ref = self._collection.document(doc_id)
-        existing_doc = doc_ref.get()
+        with span("firestore.read"):
+            existing_doc = doc_ref.get()
+        count("firestore.reads")
 
         listing.updated_at = now
         if not existing_doc.exists:
             listing.created_at = now
 
         data = listing.model_dump(mode="json")
-        doc_ref.set(data, merge=True)
+        with span("firestore.write"):
+            doc_ref.set(data, merge=True)
+        count("firestore.writes")
         print(f"Saved listing {doc_id} for URL: {listing.link}")
 
+    def save_many(
+        self, listings: List[Listing], existing_links: Optional[Collection[str]] = None
+    ) -> None:
+        """
+        Saves many listings using batched writes.
+
+        `created_at` is only written for documents that do not exist yet. Callers
+        that already know which links exist (e.g. from `find_many_by_links`) can
+        pass them as `existing_links` to skip the existence check; otherwise it is
+        done with one multi-document read that only fetches `created_at`.
+        """
+        if not listings:
+            return
+
+        refs = {self._doc_id_from_link(str(l.link)): l for l in listings}
+        if existing_links is None:
+            with span("firestore.read"):
+                snaps = list(self._client.get_all(
+                    [self._collection.document(doc_id) for doc_id in refs],
+                    field_paths=["created_at"],
+                ))
+            count("firestore.reads", len(refs))
+            existing_ids = {snap.id for snap in snaps if snap.exists}
+        else:
+            existing_ids = {self._doc_id_from_link(link) for link in existing_links}
+
+        now = datetime.now(timezone.utc)
+        items = list(refs.items())
+        for start in range(0, len(items), self._MAX_BATCH_WRITES):
+            batch = self._client.batch()
+            chunk = items[start:start + self._MAX_BATCH_WRITES]
+            for doc_id, listing in chunk:
+                listing.updated_at = now
+                if doc_id in existing_ids:
+                    # Never overwrite the original creation time of an existing document
+                    data = listing.model_dump(mode="json", exclude={"created_at"})
+                else:
+                    listing.created_at = now
+                    data = listing.model_dump(mode="json")
+                batch.set(self._collection.document(doc_id), data, merge=True)
+            with span("firestore.batch_commit"):
+                batch.commit()
+            count("firestore.writes", len(chunk))
+        print(f"Saved {len(items)} listings in batched writes.")
+
 def get_listing_repository() -> ListingRepository:
     """Factory function to get a configured ListingRepository instance."""
     client = firestore.Client(project=settings.gcp_project_id)
@@ -8,6 +8,16 @@ from azure.identity import DefaultAzureCredential
 from openai import AzureOpenAI
 
 from ..config import settings
+from ..instrumentation import count, span
+from .sqlite_cache import SqliteCache
+
+def _record_usage(resp) -> None:
+    """Counts an LLM call and the tokens it used, when the response reports them."""
+    count("llm.calls")
+    usage = getattr(resp, "usage", None)
+    if usage is not None:
+        count("llm.prompt_tokens", getattr(usage, "prompt_tokens", 0) or 0)
+        count("llm.completion_tokens", getattr(usage, "completion_tokens", 0) or 0)
 
 class Message(Dict):
     def __init__(self, role: str, content: str):
@@ -30,12 +40,14 @@ class TogetherLLM(LLM):
         print(f"TogetherLLM client initialized for model: {model}")
 
     def get_response(self, messages: List[Message], temperature: float = 0.0, **kwargs) -> str:
-        resp = self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=temperature,
-            **kwargs,
-        )
+        with span("llm.request"):
+            resp = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                **kwargs,
+            )
+        _record_usage(resp)
         return resp.choices[0].message.content or ""
 
 class AzureOpenAILLM(LLM):
@@ -56,23 +68,58 @@ class AzureOpenAILLM(LLM):
             azure_endpoint="YOUR_AZURE_ENDPOINT_HERE", # Replace with your actual endpoint
             azure_ad_token_provider=token_provider,
         )
+        self.model = "gpt-4o" # Model should be configurable
         print("AzureOpenAILLM client initialized.")
 
     def get_response(self, messages: List[Message], temperature: float = 0.0, **kwargs) -> str:
-        resp = self.client.chat.completions.create(
-            model="gpt-4o", # Model should be configurable
-            messages=messages,
-            temperature=temperature,
-            **kwargs,
-        )
+        with span("llm.request"):
+            resp = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                **kwargs,
+            )
+        _record_usage(resp)
         return resp.choices[0].message.content or ""
 
+class CachingLLM(LLM):
+    """
+    Wraps another LLM and stores its responses in a persistent cache, keyed by a
+    hash of the model, the messages, the temperature and any extra arguments.
+    """
+    def __init__(self, llm: LLM, cache: SqliteCache):
+        self.llm = llm
+        self.cache = cache
+        self.model = getattr(llm, "model", type(llm).__name__)
+        print(f"CachingLLM initialized with cache at: {cache.path}")
+
+    def get_response(self, messages: List[Message], temperature: float = 0.0, **kwargs) -> str:
+        key = SqliteCache.make_key(self.model, messages, temperature, kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            count("llm.cache_hits")
+            return cached
+
+        response = self.llm.get_response(messages, temperature=temperature, **kwargs)
+        self.cache.set(key, response)
+        return response
+
 def get_llm_client() -> LLM:
     """Factory function to create an LLM client based on app settings."""
     provider = settings.llm_provider
     if provider == "together":
-        return TogetherLLM(model=settings.together_llm_model, api_key=settings.together_api_key)
+        client: LLM = TogetherLLM(model=settings.together_llm_model, api_key=settings.together_api_key)
     elif provider == "azure":
-        return AzureOpenAILLM()
+        client = AzureOpenAILLM()
     else:
-        raise ValueError(f"Unknown LLM provider: {provider}")
\ No newline at end of file
+        raise ValueError(f"Unknown LLM provider: {provider}")
+
+    if settings.llm_cache_enabled:
+        cache = SqliteCache(
+            path=settings.llm_cache_path,
+            table="llm_responses",
+            max_entries=settings.llm_cache_max_entries,
+            max_age_seconds=settings.llm_cache_max_age_days * 86400,
+        )
+        client = CachingLLM(client, cache)
+    return client
\ No newline at end of file
@@ -1,47 +1,109 @@
 # src/boardgamefinder/adapters/marktplaats_client.py
 import json
-from typing import List, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
 import requests
 from bs4 import BeautifulSoup
 from marktplaats import SearchQuery, SortBy, SortOrder, category_from_name
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..domain.models import Listing
+from ..instrumentation import count, span
+
+class _HostRateLimiter:
+    """Spaces out request starts so each host sees at most `rate` requests per second."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        if not self._interval:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
 
 class MarktplaatsClient:
     """A client to scrape listings from Marktplaats."""
 
-    def __init__(self, user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"):
+    def __init__(
+        self,
+        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        max_workers: int = 8,
+        requests_per_second: float = 10.0,
+        max_retries: int = 3,
+    ):
         self.user_agent = user_agent
-        print("MarktplaatsClient initialized.")
+        self.max_workers = max(1, max_workers)
+        self._rate_limiter = _HostRateLimiter(requests_per_second)
+
+        # One pooled, keep-alive session shared by all detail-page workers
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers, pool_maxsize=self.max_workers, max_retries=retry
+        )
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = self.user_agent
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        print(f"MarktplaatsClient initialized with {self.max_workers} detail workers.")
 
     def _get_listing_details(self, url: str) -> Tuple[List[str], str]:
         """Fetches images and the full description for a single listing."""
         try:
-            response = requests.get(url, timeout=20, headers={"User-Agent": self.user_agent})
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            images = []
-            for data in soup.select('script[type="application/ld+json"]'):
-                try:
-                    parsed = json.loads(data.text)
-                    if isinstance(parsed, dict) and parsed.get("@type") == "Product":
-                        images.extend(f"https:{img}" for img in parsed.get("image", []))
-                        break
-                except json.JSONDecodeError:
-                    continue
-
-            desc_div = soup.select_one("div.Description-description")
-            description = ""
-            if desc_div:
-                inner = desc_div.decode_contents().replace("<br/>", "\n").replace("<br />", "\n").replace("<br>", "\n")
-                description = BeautifulSoup(inner, "html.parser").get_text().strip()
-
-            return images, description
+            with span("marktplaats.rate_limit_wait"):
+                self._rate_limiter.wait(url)
+            with span("marktplaats.detail_request"):
+                response = self._session.get(url, timeout=20)
+                response.raise_for_status()
+            count("marktplaats.detail_pages")
+            with span("marktplaats.detail_parse"):
+                return self._parse_details(response.text)
         except Exception as e:
+            count("marktplaats.detail_failures")
             print(f"Warning: Unable to get details for {url}: {e}")
             return [], ""
 
+    def _parse_details(self, html: str) -> Tuple[List[str], str]:
+        """Extracts the image URLs and the description from a listing's detail page."""
+        soup = BeautifulSoup(html, "html.parser")
+
+        images = []
+        for data in soup.select('script[type="application/ld+json"]'):
+            try:
+                parsed = json.loads(data.text)
+                if isinstance(parsed, dict) and parsed.get("@type") == "Product":
+                    images.extend(f"https:{img}" for img in parsed.get("image", []))
+                    break
+            except json.JSONDecodeError:
+                continue
+
+        desc_div = soup.select_one("div.Description-description")
+        description = ""
+        if desc_div:
+            for br in desc_div.find_all("br"):
+                br.replace_with("\n")
+            description = desc_div.get_text().strip()
+
+        return images, description
+
     def _to_listing_model(self, mp_listing) -> Listing:
         """Converts a Marktplaats listing object to our internal Listing model."""
         url = str(mp_listing.link)
@@ -59,8 +121,22 @@ class MarktplaatsClient:
             images=images or [str(img) for img in mp_listing.get_images()],
         )
 
-    def fetch_listings(self, zip_code: str, distance_km: int, category_name: str, limit: int) -> List[Listing]:
-        """Fetches a list of listings and enriches them with details."""
+    def fetch_listings(
+        self,
+        zip_code: str,
+        distance_km: int,
+        category_name: str,
+        limit: int,
+        known_links: Optional[Callable[[List[str]], Collection[str]]] = None,
+    ) -> List[Listing]:
+        """
+        Fetches a list of listings and enriches them with details.
+
+        If `known_links` is given, it is called once with the links of all search
+        results and must return those that are already known. Known listings are
+        dropped before their detail pages are fetched, so only new listings are
+        returned.
+        """
         print(f"Fetching up to {limit} listings for category '{category_name}'...")
         search = SearchQuery(
             zip_code=zip_code,
@@ -70,6 +146,20 @@ class MarktplaatsClient:
             sort_order=SortOrder.DESC,
             category=category_from_name(category_name),
         )
-        mp_listings = search.get_listings()
-        print(f"Found {len(mp_listings)} raw listings. Converting to domain models...")
-        return [self._to_listing_model(l) for l in mp_listings]
\ No newline at end of file
+        with span("marktplaats.search"):
+            mp_listings = search.get_listings()
+        count("marktplaats.search_results", len(mp_listings))
+        print(f"Found {len(mp_listings)} raw listings.")
+
+        if known_links is not None:
+            known = set(known_links([str(l.link) for l in mp_listings]))
+            for l in mp_listings:
+                if str(l.link) in known:
+                    print(f"Skipping already processed listing: {l.title}")
+            mp_listings = [l for l in mp_listings if str(l.link) not in known]
+            print(f"{len(known)} listings already known, fetching details for {len(mp_listings)}.")
+
+        print(f"Converting {len(mp_listings)} listings to domain models...")
+        # Detail pages are fetched concurrently; map() preserves the search order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(self._to_listing_model, mp_listings))
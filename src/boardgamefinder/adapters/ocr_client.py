@@ -1,39 +1,159 @@
 # src/boardgamefinder/adapters/ocr_client.py
-from typing import List
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 import requests
 from google.cloud import vision
 
+from ..config import settings
+from ..instrumentation import count, span
+from .sqlite_cache import SqliteCache
+
 class OcrClient:
     """A client for performing OCR using Google Cloud Vision API."""
-    def __init__(self):
+
+    _MAX_BATCH_SIZE = 16  # Vision limit for synchronous batch_annotate_images
+
+    def __init__(
+        self,
+        batch_size: int = 16,
+        download_workers: int = 8,
+        use_image_uris: bool = False,
+        url_cache: Optional[SqliteCache] = None,
+        content_cache: Optional[SqliteCache] = None,
+    ):
         self._client = vision.ImageAnnotatorClient()
+        self.batch_size = max(1, min(batch_size, self._MAX_BATCH_SIZE))
+        self.download_workers = max(1, download_workers)
+        self.use_image_uris = use_image_uris
+        # Earlier results keyed by image URL (skips the download) and by a hash of
+        # the image bytes (skips the Vision call for re-uploaded photos)
+        self.url_cache = url_cache
+        self.content_cache = content_cache
+        self._session = requests.Session()
         print("Google Vision OcrClient initialized.")
 
+    def cache_stats(self) -> Dict[str, Any]:
+        """Returns hit/miss statistics for the URL and content caches."""
+        stats: Dict[str, Any] = {}
+        if self.url_cache is not None:
+            stats["url"] = self.url_cache.stats()
+        if self.content_cache is not None:
+            stats["content"] = self.content_cache.stats()
+        return stats
+
+    def _remember(self, url: str, content_hash: Optional[str], text: str) -> None:
+        if self.url_cache is not None:
+            self.url_cache.set(url, text)
+        if self.content_cache is not None and content_hash is not None:
+            self.content_cache.set(content_hash, text)
+
+    def _download(self, url: str) -> Optional[bytes]:
+        """Downloads a single image, returning None on failure."""
+        try:
+            with span("ocr.download"):
+                response = self._session.get(url, timeout=20)
+                response.raise_for_status()
+            count("ocr.downloaded_bytes", len(response.content))
+            return response.content
+        except Exception as e:
+            count("ocr.download_failures")
+            print(f"Failed to download image {url} for OCR: {e}")
+            return None
+
+    def _download_all(self, image_urls: List[str]) -> List[Optional[bytes]]:
+        """Downloads the images concurrently, in input order; None marks a failed download."""
+        with ThreadPoolExecutor(max_workers=self.download_workers) as pool:
+            return list(pool.map(self._download, image_urls))
+
     def extract_text_from_urls(self, image_urls: List[str]) -> List[str]:
-        """Extracts text from a list of image URLs."""
-        results = []
+        """
+        Extracts text from a list of image URLs. Images are sent to Vision in
+        batches; the result list always matches the input order and length, with
+        an empty string for images that could not be processed.
+        """
+        # Listing.images holds pydantic URLs, which neither SQLite nor Vision accept
+        image_urls = [str(url) for url in image_urls]
+        results = [""] * len(image_urls)
         if not image_urls:
             return results
 
         print(f"Performing OCR on {len(image_urls)} images...")
-        for url in image_urls:
-            try:
-                response = requests.get(url, timeout=20)
-                response.raise_for_status()
+        count("ocr.images", len(image_urls))
+        # 1. Reuse results for URLs we have seen before
+        todo = list(range(len(image_urls)))
+        if self.url_cache is not None:
+            remaining = []
+            for i in todo:
+                cached = self.url_cache.get(image_urls[i])
+                if cached is None:
+                    remaining.append(i)
+                else:
+                    results[i] = cached
+            todo = remaining
 
-                image = vision.Image(content=response.content)
-                resp = self._client.text_detection(image=image)
+        # 2. Build Vision images, reusing results for identical image contents
+        content_hashes: Dict[int, str] = {}
+        pending = []
+        if self.use_image_uris:
+            # Let the Vision service fetch the images itself
+            pending = [
+                (i, vision.Image(source=vision.ImageSource(image_uri=image_urls[i]))) for i in todo
+            ]
+        else:
+            for i, content in zip(todo, self._download_all([image_urls[i] for i in todo])):
+                if content is None:
+                    continue
+                content_hash = hashlib.sha256(content).hexdigest()
+                cached = self.content_cache.get(content_hash) if self.content_cache is not None else None
+                if cached is not None:
+                    results[i] = cached
+                    self._remember(image_urls[i], None, cached)
+                    continue
+                content_hashes[i] = content_hash
+                pending.append((i, vision.Image(content=content)))
+
+        # 3. OCR everything that is left in batches
+        feature = vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)
+
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            annotate_requests = [vision.AnnotateImageRequest(image=image, features=[feature]) for _, image in chunk]
+            try:
+                with span("ocr.vision_batch"):
+                    batch = self._client.batch_annotate_images(requests=annotate_requests)
+                count("ocr.vision_images", len(chunk))
+            except Exception as e:
+                print(f"Vision batch request failed for {len(chunk)} images: {e}")
+                continue
 
+            for (i, _), resp in zip(chunk, batch.responses):
                 if resp.error.message:
-                    print(f"Vision API error for {url}: {resp.error.message}")
-                    results.append("")
+                    print(f"Vision API error for {image_urls[i]}: {resp.error.message}")
                     continue
-
                 text = resp.text_annotations[0].description if resp.text_annotations else ""
-                results.append(text.strip())
-            except Exception as e:
-                print(f"Failed to process image {url} for OCR: {e}")
-                results.append("")
+                results[i] = text.strip()
+                self._remember(image_urls[i], content_hashes.get(i), results[i])
         
         print("OCR processing complete.")
-        return results
\ No newline at end of file
+        return results
+
+def get_ocr_client() -> OcrClient:
+    """Factory function to create an OcrClient based on app settings."""
+    url_cache = content_cache = None
+    if settings.ocr_cache_enabled:
+        cache_args = dict(
+            path=settings.ocr_cache_path,
+            max_entries=settings.ocr_cache_max_entries,
+            max_age_seconds=settings.ocr_cache_max_age_days * 86400,
+        )
+        url_cache = SqliteCache(table="ocr_by_url", **cache_args)
+        content_cache = SqliteCache(table="ocr_by_content", **cache_args)
+
+    return OcrClient(
+        batch_size=settings.ocr_batch_size,
+        download_workers=settings.ocr_download_workers,
+        use_image_uris=settings.ocr_use_image_uris,
+        url_cache=url_cache,
+        content_cache=content_cache,
+    )
@@ -8,6 +8,9 @@ class Settings(BaseSettings):
     distance_km: int = 10
     max_listings: int = 50
     marktplaats_category_name: str = "Gezelschapsspellen | Bordspellen"
+    marktplaats_detail_workers: int = 8
+    marktplaats_requests_per_second: float = 10.0
+    marktplaats_max_retries: int = 3
 
     # LLM Provider Configuration
     llm_provider: Literal["azure", "together"] = "azure"
@@ -22,15 +25,64 @@ class Settings(BaseSettings):
     azure_tenant_id: Optional[str] = None
     azure_client_secret: Optional[str] = None
 
+    # LLM Response Cache
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = ".cache/llm_responses.sqlite"
+    llm_cache_max_entries: int = 50000
+    llm_cache_max_age_days: float = 30.0
+
+    # OCR Configuration
+    ocr_batch_size: int = 16
+    ocr_download_workers: int = 8
+    ocr_use_image_uris: bool = False
+    ocr_cache_enabled: bool = True
+    ocr_cache_path: str = ".cache/ocr.sqlite"
+    ocr_cache_max_entries: int = 100000
+    ocr_cache_max_age_days: float = 90.0
+
+    # Pipeline Concurrency (pipeline_workers=1 processes listings sequentially)
+    pipeline_workers: int = 1
+    pipeline_ocr_concurrency: int = 4
+    pipeline_extraction_concurrency: int = 4
+    pipeline_matching_concurrency: int = 4
+    pipeline_save_batch_size: int = 50 # Enriched listings are saved every this many
+
     # Core Services Configuration
     extraction_method: Literal["json"] = "json"
     matching_method: Literal["fuzzy", "llm"] = "llm"
+    # Fuzzy search backend. "trigram" scores like difflib and can reuse the index in a
+    # BGG snapshot; "rapidfuzz" (requirements-optional.txt) scores with the Indel ratio,
+    # which is never lower, so retune the fast-path thresholds; "auto" prefers rapidfuzz
+    matcher_scorer: Literal["auto", "trigram", "rapidfuzz"] = "trigram"
+
+    # LLM matcher fast path: accept unambiguous fuzzy hits without an LLM call.
+    # Off by default; measure the thresholds with evaluation/evaluate_matcher.py first
+    matcher_fast_path: bool = False
+    matcher_fast_path_min_score: float = 0.95
+    matcher_fast_path_min_margin: float = 0.1
+
+    # Memo of match outcomes per (name, language); the persistent cache spans runs and
+    # is invalidated by BGG data, prompt or matcher setting changes
+    matcher_memo_size: int = 10000
+    matcher_memo_cache_enabled: bool = False
+    matcher_memo_cache_path: str = ".cache/matches.sqlite"
+    matcher_memo_cache_max_age_days: int = 30
+
+    # Known (name, language) -> BGG ID matches, built by scripts/build_alias_index.py
+    matcher_alias_path: Optional[str] = "bgg_data/aliases.json"
+
+    # Optional embedding candidates for the LLM matcher (scripts/build_name_embeddings.py)
+    matcher_embeddings_path: Optional[str] = None
+    matcher_embedding_model_path: Optional[str] = None # Local sentence-transformers model
+    matcher_embedding_candidates: int = 10
 
     # BGG Data Source Configuration
-    bgg_repository_type: Literal["gcs", "file", "dummy"] = "gcs"
+    bgg_repository_type: Literal["gcs", "file", "snapshot", "dummy"] = "gcs"
     bgg_gcs_bucket_name: Optional[str] = "your-bgg-data-bucket"
     bgg_gcs_file_path: Optional[str] = "games.csv"
+    bgg_cache_dir: Optional[str] = ".cache/bgg" # Local copy of the GCS CSV, keyed by generation
     bgg_local_file_path: Optional[str] = "bgg_data/games.csv" # For local fallback
+    bgg_snapshot_path: Optional[str] = "bgg_data/snapshot" # Built by scripts/build_bgg_snapshot.py
 
     # BGG Filtering Rules
     bgg_min_rating: float = 0.0
@@ -43,6 +95,11 @@ class Settings(BaseSettings):
 
     # Web output
     web_output_dir: str = "docs"
+    web_incremental: bool = True
+    web_state_path: str = ".cache/site_state.json" # Materialized listing view for incremental builds
+
+    # Run report: per-stage timings (p50/p95) and counters, written at the end of each run
+    run_report_path: Optional[str] = "docs/run_report.json"
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -0,0 +1,110 @@
+# src/boardgamefinder/instrumentation.py
+"""
+Lightweight, process-wide run instrumentation.
+
+Wrap work in `span("stage.name")` (or decorate a function with `timed`) to
+record its duration, and call `count("counter.name", n)` for things like LLM
+tokens or Firestore writes. `write_report` dumps per-stage percentiles and all
+counters as JSON at the end of a run. Everything is thread-safe.
+"""
+import functools
+import json
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_lock = threading.Lock()
+_durations: Dict[str, List[float]] = defaultdict(list)
+_counters: Dict[str, float] = defaultdict(float)
+_started_at = datetime.now(timezone.utc)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Records the wall-clock duration of the enclosed block under `name`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            _durations[name].append(elapsed)
+
+
+def timed(name: str) -> Callable:
+    """Decorator that records every call of the function as a `span(name)`."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name: str, n: float = 1) -> None:
+    """Adds `n` to the counter `name`."""
+    with _lock:
+        _counters[name] += n
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summary() -> Dict[str, Any]:
+    """Returns per-stage timing statistics (in seconds) and all counters."""
+    with _lock:
+        durations = {name: sorted(values) for name, values in _durations.items()}
+        counters = dict(_counters)
+
+    stages = {}
+    for name, values in sorted(durations.items()):
+        total = sum(values)
+        stages[name] = {
+            "count": len(values),
+            "total_s": round(total, 3),
+            "mean_s": round(total / len(values), 4),
+            "p50_s": round(percentile(values, 50), 4),
+            "p95_s": round(percentile(values, 95), 4),
+            "max_s": round(values[-1], 4),
+        }
+    return {
+        "stages": stages,
+        "counters": {name: int(v) if float(v).is_integer() else round(v, 3) for name, v in sorted(counters.items())},
+    }
+
+
+def write_report(path: str, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Writes the run summary, plus any `extra` sections, as JSON to `path` and returns it."""
+    finished_at = datetime.now(timezone.utc)
+    report = {
+        "started_at": _started_at.isoformat(),
+        "finished_at": finished_at.isoformat(),
+        "duration_s": round((finished_at - _started_at).total_seconds(), 1),
+        **summary(),
+        **(extra or {}),
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"Run report written to {path}")
+    return report
+
+
+def reset() -> None:
+    """Clears all recorded spans and counters and restarts the run clock."""
+    global _started_at
+    with _lock:
+        _durations.clear()
+        _counters.clear()
+        _started_at = datetime.now(timezone.utc)
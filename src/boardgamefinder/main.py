@@ -1,11 +1,13 @@
 # src/boardgamefinder/main.py
 
+from .config import settings
+from .instrumentation import span, write_report
 from .adapters.firestore_repository import get_listing_repository
-from .adapters.ocr_client import OcrClient
-from .adapters.llm_client import get_llm_client
+from .adapters.ocr_client import get_ocr_client
+from .adapters.llm_client import CachingLLM, get_llm_client
 from .adapters.bgg_repository import get_bgg_repository
 from .services.extractor import JsonNameExtractor
-from .services.matcher import FuzzyNameMatcher, LLMNameMatcher
+from .services.matcher import get_name_matcher
 from .pipeline.enrich_listing import ListingEnricher
 from .pipeline.run_pipeline import run_pipeline
 from .web.generator import WebGenerator
@@ -13,17 +15,21 @@ from .web.generator import WebGenerator
 
 def main():
     print("Initializing components for scheduled run...")
-    listing_repo = get_listing_repository()
-    ocr_client = OcrClient()
-    llm_client = get_llm_client()
-    bgg_repo = get_bgg_repository()
-
-    extractor = JsonNameExtractor(client=llm_client)
-    matcher = LLMNameMatcher(repository=bgg_repo, llm_client=llm_client)
+    with span("main.init"):
+        listing_repo = get_listing_repository()
+        ocr_client = get_ocr_client()
+        llm_client = get_llm_client()
+        bgg_repo = get_bgg_repository()
+
+        extractor = JsonNameExtractor(client=llm_client)
+        matcher = get_name_matcher(repository=bgg_repo, llm_client=llm_client)
     enricher = ListingEnricher(
         ocr_client=ocr_client,
         extractor=extractor,
         matcher=matcher,
+        ocr_concurrency=settings.pipeline_ocr_concurrency,
+        extraction_concurrency=settings.pipeline_extraction_concurrency,
+        matching_concurrency=settings.pipeline_matching_concurrency,
     )
 
     # 1) Run the pipeline
@@ -37,6 +43,21 @@ def main():
     else:
         print("No new listings – skipping website generation.")
 
+    report_extra = {
+        "new_listings": new_count,
+        "ocr_cache": ocr_client.cache_stats(),
+        "matcher_decisions": dict(matcher.stats),
+        "matcher_memo": matcher.memo_stats(),
+    }
+    print(f"OCR cache stats: {report_extra['ocr_cache']}")
+    print(f"Matcher decisions: {report_extra['matcher_decisions']}, memo: {report_extra['matcher_memo']}")
+    if isinstance(llm_client, CachingLLM):
+        report_extra["llm_cache"] = llm_client.cache.stats()
+        print(f"LLM cache stats: {report_extra['llm_cache']}")
+
+    if settings.run_report_path:
+        write_report(settings.run_report_path, extra=report_extra)
+
 
 if __name__ == "__main__":
     main()
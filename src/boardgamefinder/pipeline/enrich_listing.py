@@ -1,42 +1,77 @@
 # src/boardgamefinder/pipeline/enrich_listing.py
+import contextlib
+import threading
+from typing import ContextManager, Optional
+
 from ..domain.models import Game, Listing
+from ..instrumentation import count, span
 from ..services.extractor import NameExtractor
 from ..services.matcher import NameMatcher
 from ..adapters.ocr_client import OcrClient
 
+def _stage_limit(max_concurrent: Optional[int]) -> ContextManager:
+    """Returns a context manager that caps how many threads may run a stage at once."""
+    if not max_concurrent:
+        return contextlib.nullcontext()
+    return threading.BoundedSemaphore(max_concurrent)
+
 class ListingEnricher:
     """
     Handles the full enrichment of a Listing object by coordinating OCR,
     LLM extraction, and BGG name matching.
+
+    `enrich` is safe to call from several threads at once; the optional
+    per-stage limits bound how many listings may be in each stage concurrently.
     """
-    def __init__(self, ocr_client: OcrClient, extractor: NameExtractor, matcher: NameMatcher):
+    def __init__(
+        self,
+        ocr_client: OcrClient,
+        extractor: NameExtractor,
+        matcher: NameMatcher,
+        ocr_concurrency: Optional[int] = None,
+        extraction_concurrency: Optional[int] = None,
+        matching_concurrency: Optional[int] = None,
+    ):
         self.ocr_client = ocr_client
         self.extractor = extractor
         self.matcher = matcher
+        self._ocr_limit = _stage_limit(ocr_concurrency)
+        self._extraction_limit = _stage_limit(extraction_concurrency)
+        self._matching_limit = _stage_limit(matching_concurrency)
         print("ListingEnricher initialized.")
 
     def enrich(self, listing: Listing) -> Listing:
         """Orchestrates the enrichment process for a single listing."""
+        with span("enrich.listing"):
+            return self._enrich(listing)
+
+    def _enrich(self, listing: Listing) -> Listing:
         print(f"Enriching listing: {listing.title}")
         
         # 1. Extract text from images via OCR
-        listing.image_texts = self.ocr_client.extract_text_from_urls(listing.images)
+        with self._ocr_limit, span("enrich.ocr"):
+            listing.image_texts = self.ocr_client.extract_text_from_urls(listing.images)
 
         # 2. Extract game names using the LLM
-        extracted_games_data = self.extractor.extract(
-            title=listing.title,
-            description=listing.description,
-            image_texts=listing.image_texts
-        )
+        with self._extraction_limit, span("enrich.extraction"):
+            extracted_games_data = self.extractor.extract(
+                title=listing.title,
+                description=listing.description,
+                image_texts=listing.image_texts
+            )
         
         # This will overwrite any existing games on the listing
         listing.games = [Game(**item) for item in extracted_games_data]
 
-        # 3. Match each extracted game with BGG data
-        for game in listing.games:
-            bgg_match = self.matcher.match(game.llm_name, game.llm_lang)
+        # 3. Match all extracted games with BGG data in one go
+        count("enrich.games", len(listing.games))
+        with self._matching_limit, span("enrich.matching"):
+            bgg_matches = self.matcher.match_many(
+                [(game.llm_name, game.llm_lang) for game in listing.games]
+            )
+        for game, bgg_match in zip(listing.games, bgg_matches):
             if bgg_match:
                 game.bgg_data = bgg_match
 
         print(f"Enrichment complete for: {listing.title}")
-        return listing
\ No newline at end of file
+        return listing
@@ -0,0 +1,231 @@
+# src/boardgamefinder/pipeline/reprocess.py
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from ..adapters.firestore_repository import ListingRepository
+from ..domain.models import Game, Listing
+from ..services.extractor import NameExtractor
+from ..services.matcher import NameMatcher
+
+
+def _games_key(games: List[Game]) -> str:
+    """Order-independent representation of a listing's games, for change detection."""
+    dumped = sorted((g.model_dump(mode="json") for g in games), key=lambda g: g["llm_name"])
+    return json.dumps(dumped, sort_keys=True)
+
+
+def listing_shard(link: str, num_shards: int) -> int:
+    """Returns the shard (0 <= shard < num_shards) a listing belongs to, stable across runs."""
+    return int(hashlib.sha256(link.encode("utf-8")).hexdigest()[:16], 16) % num_shards
+
+
+class ListingReprocessor:
+    """
+    Reruns LLM extraction and/or BGG name matching over every stored listing.
+
+    Listings are streamed a page at a time and processed by `workers` threads.
+    Changed listings are written with one batched `save_many` per page, after
+    which the page's last document ID is written to `checkpoint_path`, so an
+    interrupted run resumes after the last saved page. With `num_shards` > 1, only
+    listings of shard `shard` are processed, so several processes (each with
+    its own checkpoint) can split the collection.
+
+    With an extractor, games whose extraction changed are replaced and their BGG
+    matches cleared; with a matcher, the games are (re)matched afterwards.
+    """
+
+    def __init__(
+        self,
+        repo: ListingRepository,
+        extractor: Optional[NameExtractor] = None,
+        matcher: Optional[NameMatcher] = None,
+        workers: int = 8,
+        page_size: int = 500,
+        shard: int = 0,
+        num_shards: int = 1,
+        checkpoint_path: Optional[str] = None,
+        dry_run: bool = False,
+    ):
+        if extractor is None and matcher is None:
+            raise ValueError("ListingReprocessor needs an extractor, a matcher, or both.")
+        if not 0 <= shard < num_shards:
+            raise ValueError(f"Shard {shard} is out of range for {num_shards} shards.")
+        self.repo = repo
+        self.extractor = extractor
+        self.matcher = matcher
+        self.workers = workers
+        self.page_size = page_size
+        self.shard = shard
+        self.num_shards = num_shards
+        self.checkpoint_path = checkpoint_path
+        self.dry_run = dry_run
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return {}
+        with open(self.checkpoint_path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if (checkpoint.get("shard"), checkpoint.get("num_shards")) != (self.shard, self.num_shards):
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} belongs to shard "
+                f"{checkpoint.get('shard')}/{checkpoint.get('num_shards')}; pass --restart to discard it."
+            )
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        if self.dry_run or not self.checkpoint_path:
+            return
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def reprocess(self, listing: Listing) -> bool:
+        """Reprocesses one listing in place and returns whether its games changed."""
+        before = _games_key(listing.games)
+        games = listing.games
+
+        if self.extractor is not None:
+            extracted = self.extractor.extract(
+                title=listing.title,
+                description=listing.description,
+                image_texts=listing.image_texts,
+            )
+            new_games = [Game(**item) for item in extracted]
+            # Keep existing games (and their matches) if the extraction is unchanged
+            if _games_key(new_games) != _games_key([g.model_copy(update={"bgg_data": None}) for g in games]):
+                games = new_games
+
+        if self.matcher is not None and games:
+            matches = self.matcher.match_many([(g.llm_name, g.llm_lang) for g in games])
+            for game, bgg_data in zip(games, matches):
+                game.bgg_data = bgg_data
+
+        listing.games = games
+        return _games_key(games) != before
+
+    def _reprocess_safely(self, listing: Listing) -> Optional[bool]:
+        """Like `reprocess`, but returns None instead of raising."""
+        try:
+            return self.reprocess(listing)
+        except Exception as e:
+            print(f"Failed to reprocess {listing.link}: {e}")
+            return None
+
+    def run(self, restart: bool = False) -> Dict[str, Any]:
+        """Processes the (remaining) listings of this shard and returns the run's counters."""
+        checkpoint = {} if restart else self._load_checkpoint()
+        if checkpoint.get("done"):
+            print(f"Checkpoint {self.checkpoint_path} is already complete; pass --restart to run again.")
+            return checkpoint
+        checkpoint = {
+            "shard": self.shard,
+            "num_shards": self.num_shards,
+            "last_doc_id": checkpoint.get("last_doc_id"),
+            "processed": checkpoint.get("processed", 0),
+            "changed": checkpoint.get("changed", 0),
+            "failed": checkpoint.get("failed", []),
+            "done": False,
+        }
+        if checkpoint["last_doc_id"]:
+            print(f"Resuming after document {checkpoint['last_doc_id']} ({checkpoint['processed']} already processed).")
+
+        started = time.perf_counter()
+        processed_this_run = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pages = self.repo.iter_pages(page_size=self.page_size, start_after=checkpoint["last_doc_id"])
+            for page, last_doc_id in pages:
+                listings = [
+                    l for l in page
+                    if listing_shard(str(l.link), self.num_shards) == self.shard
+                ]
+                outcomes = list(executor.map(self._reprocess_safely, listings))
+
+                changed = [l for l, outcome in zip(listings, outcomes) if outcome]
+                failed = [str(l.link) for l, outcome in zip(listings, outcomes) if outcome is None]
+                if changed and not self.dry_run:
+                    self.repo.save_many(changed, existing_links=[str(l.link) for l in changed])
+
+                processed_this_run += len(listings)
+                checkpoint["processed"] += len(listings)
+                checkpoint["changed"] += len(changed)
+                checkpoint["failed"].extend(failed)
+                checkpoint["last_doc_id"] = last_doc_id
+                self._save_checkpoint(checkpoint)
+
+                elapsed = time.perf_counter() - started
+                print(
+                    f"[shard {self.shard}/{self.num_shards}] {checkpoint['processed']} processed, "
+                    f"{checkpoint['changed']} changed, {len(checkpoint['failed'])} failed "
+                    f"({processed_this_run / elapsed:.1f} listings/s)"
+                )
+
+        checkpoint["done"] = True
+        self._save_checkpoint(checkpoint)
+        elapsed = time.perf_counter() - started
+        checkpoint["elapsed_seconds"] = round(elapsed, 1)
+        checkpoint["listings_per_second"] = round(processed_this_run / elapsed, 2) if elapsed else 0.0
+        return checkpoint
+
+
+def add_reprocess_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the command-line options shared by the reprocessing scripts."""
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Run the script without writing any changes (or a checkpoint)."
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Listings processed concurrently (default: 8).")
+    parser.add_argument("--page-size", type=int, default=500, help="Listings read and saved per page (default: 500).")
+    parser.add_argument("--shard", type=int, default=0, help="Shard of the collection to process (default: 0).")
+    parser.add_argument("--num-shards", type=int, default=1, help="Total number of shards (default: 1).")
+    parser.add_argument(
+        "--checkpoint",
+        help="Checkpoint file (default: .cache/reprocess-<mode>-<shard>-of-<num-shards>.json).",
+    )
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint.")
+
+
+def run_reprocessing(
+    args: argparse.Namespace,
+    repo: ListingRepository,
+    mode: str,
+    extractor: Optional[NameExtractor] = None,
+    matcher: Optional[NameMatcher] = None,
+) -> Dict[str, Any]:
+    """Runs a ListingReprocessor configured from `add_reprocess_arguments` options and prints a summary."""
+    checkpoint_path = args.checkpoint or os.path.join(
+        ".cache", f"reprocess-{mode}-{args.shard}-of-{args.num_shards}.json"
+    )
+    reprocessor = ListingReprocessor(
+        repo,
+        extractor=extractor,
+        matcher=matcher,
+        workers=args.workers,
+        page_size=args.page_size,
+        shard=args.shard,
+        num_shards=args.num_shards,
+        checkpoint_path=checkpoint_path,
+        dry_run=args.dry_run,
+    )
+    result = reprocessor.run(restart=args.restart)
+
+    print(f"\n--- Reprocessing Finished ---")
+    print(f"Processed {result['processed']} listings, {result['changed']} changed.")
+    if "listings_per_second" in result:
+        print(f"This run: {result['elapsed_seconds']}s, {result['listings_per_second']} listings/s.")
+    if result["failed"]:
+        print(f"{len(result['failed'])} listings failed:")
+        for link in result["failed"]:
+            print(f"  - {link}")
+    if args.dry_run:
+        print("This was a dry run. No data was modified.")
+    return result
@@ -1,45 +1,89 @@
 # src/boardgamefinder/pipeline/run_pipeline.py
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set
+
 from ..config import settings
 from ..adapters.marktplaats_client import MarktplaatsClient
 from ..adapters.firestore_repository import ListingRepository, get_listing_repository
-from ..adapters.ocr_client import OcrClient
+from ..adapters.ocr_client import get_ocr_client
 from ..adapters.llm_client import get_llm_client
 from ..adapters.bgg_repository import get_bgg_repository
+from ..domain.models import Listing
+from ..instrumentation import count, span
 from ..services.extractor import JsonNameExtractor
-from ..services.matcher import FuzzyNameMatcher, LLMNameMatcher
+from ..services.matcher import get_name_matcher
 from .enrich_listing import ListingEnricher
 
-def run_pipeline(enricher: ListingEnricher, repo: ListingRepository):
-    """Executes the full end-to-end data processing pipeline."""
+def run_pipeline(enricher: ListingEnricher, repo: ListingRepository, workers: Optional[int] = None):
+    """
+    Executes the full end-to-end data processing pipeline.
+
+    New listings are enriched on a pool of `workers` threads (defaults to
+    `settings.pipeline_workers`). The repository is read once for all scraped
+    links and every enriched listing is saved exactly once, in batched writes of
+    `settings.pipeline_save_batch_size` listings as they complete.
+    """
     print("--- Starting BoardGameFinder Pipeline ---")
+    workers = max(1, workers or settings.pipeline_workers)
 
     # 1. Scrape new listings from Marktplaats
-    mp_client = MarktplaatsClient()
-    scraped_listings = mp_client.fetch_listings(
-        zip_code=settings.zip_code,
-        distance_km=settings.distance_km,
-        limit=settings.max_listings,
-        category_name=settings.marktplaats_category_name
+    mp_client = MarktplaatsClient(
+        max_workers=settings.marktplaats_detail_workers,
+        requests_per_second=settings.marktplaats_requests_per_second,
+        max_retries=settings.marktplaats_max_retries,
     )
+    # Already processed listings are skipped before their detail pages are fetched
+    cached_listings: Dict[str, Listing] = {}
+
+    def processed_links(links: List[str]) -> Set[str]:
+        cached_listings.update(repo.find_many_by_links(links))
+        return {link for link, cached in cached_listings.items() if cached.games}
+
+    with span("pipeline.scrape"):
+        new_listings = mp_client.fetch_listings(
+            zip_code=settings.zip_code,
+            distance_km=settings.distance_km,
+            limit=settings.max_listings,
+            category_name=settings.marktplaats_category_name,
+            known_links=processed_links,
+        )
+    count("pipeline.new_listings", len(new_listings))
 
+    # 2. Enrich the new listings with games and BGG data
+    print(f"Enriching {len(new_listings)} new listings with {workers} worker(s)...")
+    save_batch_size = max(1, settings.pipeline_save_batch_size)
+    unsaved: List[Listing] = []
     new_listings_count = 0
-    # 2. Process each listing
-    for listing in scraped_listings:
-        # Check if the listing already exists and has been processed
-        cached = repo.find_by_link(str(listing.link))
-        if cached and cached.games:
-            print(f"Skipping already processed listing: {listing.title}")
-            continue
 
-        new_listings_count += 1
-        # Enrich the new listing with games and BGG data
-        enriched_listing = enricher.enrich(listing)
+    def save_unsaved():
+        # 3. Save what was enriched so far, each listing exactly once
+        nonlocal new_listings_count
+        if not unsaved:
+            return
+        with span("pipeline.save"):
+            repo.save_many(unsaved, existing_links=cached_listings.keys())
+        new_listings_count += len(unsaved)
+        unsaved.clear()
 
-        # Save the result to the database
-        repo.save(enriched_listing)
+    try:
+        with span("pipeline.enrich"), ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(enricher.enrich, listing): listing for listing in new_listings}
+            for future in as_completed(futures):
+                try:
+                    unsaved.append(future.result())
+                except Exception as e:
+                    # Keep collecting the other listings; this one is retried next run
+                    count("pipeline.enrich_failures")
+                    print(f"Failed to enrich listing {futures[future].link}: {e}")
+                    continue
+                # Saved in batches, so a killed run only loses the last few listings
+                if len(unsaved) >= save_batch_size:
+                    save_unsaved()
+    finally:
+        save_unsaved()
 
     print(f"--- Pipeline Finished ---")
-    print(f"Processed {new_listings_count} new listings out of {len(scraped_listings)} found.")
+    print(f"Processed {new_listings_count} new listings.")
     return new_listings_count
 
 
@@ -47,19 +91,22 @@ if __name__ == "__main__":
     # 1. Initialize all necessary components from adapters and services
     print("Initializing components for pipeline run...")
     listing_repo = get_listing_repository()
-    ocr_client = OcrClient()
+    ocr_client = get_ocr_client()
     llm_client = get_llm_client()
     bgg_repo = get_bgg_repository()
 
     # 2. Set up the extractor and matcher services
     extractor = JsonNameExtractor(client=llm_client)
-    matcher = LLMNameMatcher(repository=bgg_repo, llm_client=llm_client)
+    matcher = get_name_matcher(repository=bgg_repo, llm_client=llm_client)
 
     # 3. Create the main enricher service
     enricher = ListingEnricher(
         ocr_client=ocr_client,
         extractor=extractor,
-        matcher=matcher
+        matcher=matcher,
+        ocr_concurrency=settings.pipeline_ocr_concurrency,
+        extraction_concurrency=settings.pipeline_extraction_concurrency,
+        matching_concurrency=settings.pipeline_matching_concurrency,
     )
 
     # 4. Run the pipeline with the configured components
@@ -111,17 +111,8 @@ OUTPUT FORMAT
 - Do not include comments, explanations, or any extra text before or after the JSON.
 """
 
-MATCHER_SYSTEM_PROMPT = """
-You are an expert board game librarian. Your task is to identify the correct BoardGameGeek (BGG) entry for a given game name from a list of potential candidates.
-
-The user will provide:
-1.  An "Original game name" from a marketplace listing.
-2.  The `llm_lang` of the name, which will be "nl" (Dutch), "en" (English), or "unknown".
-3.  A list of "Candidate games" from the BGG database, each with a BGG ID and a name.
-
-Your goal is to find the single best match. Follow these rules strictly in order:
-
-1.  **Exact Match & Translation:**
+# Candidate-selection rules shared by the single and batched matcher prompts
+_MATCHER_RULES = """1.  **Exact Match & Translation:**
     - First, look for a candidate whose name is an exact or near-exact match for the "Original game name".
     - If `llm_lang` is "nl", you MUST also consider simple English translations of key terms. Examples:
         - "1000 Nieuwe Vragen" -> "1000 New Questions"
@@ -136,9 +127,41 @@ Your goal is to find the single best match. Follow these rules strictly in order
     - **CRITICAL: DO NOT** select a candidate that is a *different* expansion. For example, if the original is "Ticket to Ride: Nederland" and the only relevant candidates are "Ticket to Ride: Amsterdam" and "Ticket to Ride", you **MUST** choose "Ticket to Ride". Choosing "Amsterdam" is a failure.
     - For a local edition that is not on BGG (e.g., "Monopoly: Bathmen"), you will not find an exact match. The correct response is the base game "Monopoly".
 
-3.  **Final Decision:**
+"""
+
+MATCHER_SYSTEM_PROMPT = """
+You are an expert board game librarian. Your task is to identify the correct BoardGameGeek (BGG) entry for a given game name from a list of potential candidates.
+
+The user will provide:
+1.  An "Original game name" from a marketplace listing.
+2.  The `llm_lang` of the name, which will be "nl" (Dutch), "en" (English), or "unknown".
+3.  A list of "Candidate games" from the BGG database, each with a BGG ID and a name.
+
+Your goal is to find the single best match. Follow these rules strictly in order:
+
+""" + _MATCHER_RULES + """3.  **Final Decision:**
     - If you find a good match following the rules above, respond with **only the BGG ID** of that match.
     - If, after applying all rules, you cannot find a good match for the expansion AND cannot identify a suitable base game to fall back to, respond with the single word **None**.
 
 Do not provide any explanation or additional text. Your entire response must be either a single BGG ID or the word "None".
-"""
\ No newline at end of file
+"""
+
+MATCHER_BATCH_SYSTEM_PROMPT = """
+You are an expert board game librarian. Your task is to identify the correct BoardGameGeek (BGG) entry for each of several game names from a single marketplace listing, each with its own list of potential candidates.
+
+The user will provide one numbered block per game ("Game 1", "Game 2", ...), each containing:
+1.  An "Original game name" from a marketplace listing.
+2.  The `llm_lang` of the name, which will be "nl" (Dutch), "en" (English), or "unknown".
+3.  A list of "Candidate games" from the BGG database, each with a BGG ID and a name.
+
+Treat every game independently: only choose a BGG ID from that game's own candidates. For each game, find the single best match. Follow these rules strictly in order:
+
+""" + _MATCHER_RULES + """3.  **Final Decision:**
+    - If you find a good match for a game following the rules above, its answer is **only the BGG ID** of that match.
+    - If, after applying all rules, you cannot find a good match for the expansion AND cannot identify a suitable base game to fall back to, its answer is null.
+
+Respond with **only** a JSON object that maps every game number (as a string) to its answer, for example:
+{"1": "12345", "2": null}
+
+Do not provide any explanation, comments, or text before or after the JSON.
+"""
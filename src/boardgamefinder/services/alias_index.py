@@ -0,0 +1,118 @@
+# src/boardgamefinder/services/alias_index.py
+import hashlib
+import json
+import os
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..config import settings
+
+_ALIAS_VERSION = 1
+
+# Evaluation cases are hand-checked, so one of them outweighs many listing matches
+CASE_WEIGHT = 1000
+
+
+class AliasIndex:
+    """
+    Maps a normalized game name plus its `llm_lang` to a BGG ID, for titles whose
+    match is already known (e.g. recurring Dutch titles), so they can be
+    resolved without a fuzzy search or LLM call.
+    """
+
+    def __init__(self, aliases: Optional[Dict[Tuple[str, str], int]] = None):
+        self._aliases: Dict[Tuple[str, str], int] = dict(aliases or {})
+
+    def __len__(self) -> int:
+        return len(self._aliases)
+
+    def __iter__(self) -> Iterator[Tuple[str, str, int]]:
+        for (name, lang), bgg_id in sorted(self._aliases.items()):
+            yield name, lang, bgg_id
+
+    def fingerprint(self) -> str:
+        """Returns a hash of the aliases, which changes whenever any alias does."""
+        payload = json.dumps(list(self), ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, norm_name: str, llm_lang: str) -> Optional[int]:
+        """Returns the aliased BGG ID for a normalized name and language, if any."""
+        return self._aliases.get((norm_name, llm_lang))
+
+    @classmethod
+    def load(cls, path: str) -> "AliasIndex":
+        """Loads an alias file written by `AliasIndexBuilder.save`."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _ALIAS_VERSION:
+            raise ValueError(f"Unsupported alias file version in {path}: {data.get('version')}")
+        return cls({(a["name"], a["lang"]): int(a["bgg_id"]) for a in data["aliases"]})
+
+
+class AliasIndexBuilder:
+    """
+    Collects observed (name, lang) -> BGG ID matches and keeps only the aliases
+    that were seen often enough and agree with each other.
+    """
+
+    def __init__(self):
+        self._counts: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+        self._sources: Dict[Tuple[str, str], set] = defaultdict(set)
+
+    def add(self, norm_name: str, llm_lang: str, bgg_id: int, source: str, weight: int = 1) -> None:
+        if not norm_name:
+            return
+        key = (norm_name, llm_lang)
+        self._counts[key][int(bgg_id)] += weight
+        self._sources[key].add(source)
+
+    def entries(self, min_count: int = 2, min_agreement: float = 0.8) -> List[Dict[str, Any]]:
+        """
+        Returns one entry per accepted alias. An alias is accepted when its most
+        common BGG ID was seen at least `min_count` times and accounts for at least
+        `min_agreement` of all observations of that name and language.
+        """
+        entries = []
+        for (name, lang), counts in sorted(self._counts.items()):
+            bgg_id, count = counts.most_common(1)[0]
+            total = sum(counts.values())
+            if count < min_count or count / total < min_agreement:
+                continue
+            entries.append({
+                "name": name,
+                "lang": lang,
+                "bgg_id": bgg_id,
+                "count": count,
+                "agreement": round(count / total, 3),
+                "sources": sorted(self._sources[(name, lang)]),
+            })
+        return entries
+
+    def save(self, path: str, min_count: int = 2, min_agreement: float = 0.8) -> int:
+        """Writes the accepted aliases to `path` and returns how many were written."""
+        entries = self.entries(min_count=min_count, min_agreement=min_agreement)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": _ALIAS_VERSION,
+                "built_at": datetime.now(timezone.utc).isoformat(),
+                "min_count": min_count,
+                "min_agreement": min_agreement,
+                "aliases": entries,
+            }, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return len(entries)
+
+
+def get_alias_index() -> Optional[AliasIndex]:
+    """Factory function returning the configured AliasIndex, or None if there is none."""
+    path = settings.matcher_alias_path
+    if not path or not os.path.exists(path):
+        return None
+    aliases = AliasIndex.load(path)
+    print(f"Loaded {len(aliases)} name aliases from {path}.")
+    return aliases
@@ -0,0 +1,173 @@
+# src/boardgamefinder/services/embedding_retriever.py
+import json
+import os
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import hnswlib
+except ImportError:  # Optional: without it, retrieval is an exact numpy scan
+    hnswlib = None
+
+from ..config import settings
+
+# Maps a list of texts to L2-normalized embeddings, one row per text
+Encoder = Callable[[List[str]], np.ndarray]
+
+_MANIFEST = "manifest.json"
+_NAMES_FILE = "names.npy"
+_EMBEDDINGS_FILE = "embeddings.npy"
+_ANN_FILE = "hnsw.bin"
+
+
+def load_sentence_transformer(model_path: str, batch_size: int = 64) -> Encoder:
+    """
+    Loads a sentence-transformers model from a local directory (no downloads) and
+    returns an encoder for it. Requires the optional `sentence-transformers` package.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError as e:
+        raise ImportError(
+            "Embedding retrieval requires the 'sentence-transformers' package."
+        ) from e
+
+    model = SentenceTransformer(model_path, device="cpu", local_files_only=True)
+
+    def encode(texts: List[str]) -> np.ndarray:
+        embeddings = model.encode(
+            texts, batch_size=batch_size, normalize_embeddings=True, show_progress_bar=False
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+
+    return encode
+
+
+class EmbeddingRetriever:
+    """
+    Semantic nearest-name lookup over a precomputed embedding matrix of BGG names.
+
+    Complements character-level fuzzy search for translated titles, e.g.
+    "kolonisten van catan" vs "catan". Uses an HNSW index when one was built and
+    `hnswlib` is installed, and an exact dot-product scan otherwise.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        embeddings: np.ndarray,
+        encoder: Encoder,
+        ann_index: Optional["hnswlib.Index"] = None,
+    ):
+        if len(names) != len(embeddings):
+            raise ValueError(f"Got {len(names)} names but {len(embeddings)} embeddings.")
+        self.names = list(names)
+        self._embeddings = embeddings
+        self._encoder = encoder
+        self._ann_index = ann_index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search_many(self, queries: Sequence[str], n: int) -> List[List[Tuple[int, float]]]:
+        """
+        Returns up to `n` (position, cosine similarity) pairs per query, best first.
+        Positions refer to `names`. All queries are encoded in one batch.
+        """
+        if not queries or n <= 0 or not self.names:
+            return [[] for _ in queries]
+        n = min(n, len(self.names))
+        query_embeddings = self._encoder(list(queries))
+
+        if self._ann_index is not None:
+            self._ann_index.set_ef(max(n * 4, 50))
+            labels, distances = self._ann_index.knn_query(query_embeddings, k=n)
+            return [
+                [(int(pos), 1.0 - float(dist)) for pos, dist in zip(row_labels, row_distances)]
+                for row_labels, row_distances in zip(labels, distances)
+            ]
+
+        scores = query_embeddings @ self._embeddings.T
+        results = []
+        for row in scores:
+            top = np.argpartition(-row, n - 1)[:n]
+            top = top[np.argsort(-row[top])]
+            results.append([(int(pos), float(row[pos])) for pos in top])
+        return results
+
+    def search(self, query: str, n: int) -> List[Tuple[int, float]]:
+        return self.search_many([query], n)[0]
+
+    @classmethod
+    def load(cls, path: str, encoder: Encoder, use_ann: bool = True) -> "EmbeddingRetriever":
+        """Loads a directory written by `write_name_embeddings`, memory-mapping the matrix."""
+        with open(os.path.join(path, _MANIFEST), encoding="utf-8") as f:
+            manifest = json.load(f)
+        names = np.load(os.path.join(path, _NAMES_FILE)).tolist()
+        embeddings = np.load(os.path.join(path, _EMBEDDINGS_FILE), mmap_mode="r")
+
+        ann_index = None
+        ann_path = os.path.join(path, _ANN_FILE)
+        if use_ann and hnswlib is not None and os.path.exists(ann_path):
+            ann_index = hnswlib.Index(space="cosine", dim=manifest["dim"])
+            ann_index.load_index(ann_path, max_elements=len(names))
+        print(
+            f"Loaded {len(names)} name embeddings from {path} "
+            f"({'HNSW' if ann_index is not None else 'exact'} search)."
+        )
+        return cls(names, embeddings, encoder, ann_index=ann_index)
+
+
+def write_name_embeddings(
+    path: str,
+    names: Sequence[str],
+    encoder: Encoder,
+    model_path: str,
+    build_ann: bool = True,
+    batch_size: int = 1024,
+) -> None:
+    """
+    Encodes `names` and writes them with their embedding matrix (and, when
+    `hnswlib` is installed and `build_ann` is set, an HNSW index) to `path`.
+    """
+    os.makedirs(path, exist_ok=True)
+    names = list(names)
+    chunks = []
+    for start in range(0, len(names), batch_size):
+        chunks.append(encoder(names[start:start + batch_size]))
+        print(f"Encoded {min(start + batch_size, len(names))}/{len(names)} names...")
+    embeddings = np.vstack(chunks).astype(np.float32) if chunks else np.zeros((0, 0), np.float32)
+
+    np.save(os.path.join(path, _NAMES_FILE), np.array(names, dtype=str), allow_pickle=False)
+    np.save(os.path.join(path, _EMBEDDINGS_FILE), embeddings, allow_pickle=False)
+
+    ann_path = os.path.join(path, _ANN_FILE)
+    if build_ann and hnswlib is not None and len(names):
+        print("Building HNSW index...")
+        ann_index = hnswlib.Index(space="cosine", dim=embeddings.shape[1])
+        ann_index.init_index(max_elements=len(names), ef_construction=200, M=16)
+        ann_index.add_items(embeddings, np.arange(len(names)))
+        ann_index.save_index(ann_path)
+    elif os.path.exists(ann_path):
+        os.remove(ann_path)  # Never leave an index for a previous set of names
+    if build_ann and hnswlib is None:
+        print("hnswlib is not installed; retrieval will use an exact scan.")
+
+    manifest = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "model": model_path,
+        "names": len(names),
+        "dim": int(embeddings.shape[1]) if embeddings.size else 0,
+    }
+    with open(os.path.join(path, _MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def get_embedding_retriever() -> Optional[EmbeddingRetriever]:
+    """Factory function returning the configured EmbeddingRetriever, or None if disabled."""
+    if not settings.matcher_embeddings_path or not settings.matcher_embedding_model_path:
+        return None
+    encoder = load_sentence_transformer(settings.matcher_embedding_model_path)
+    return EmbeddingRetriever.load(settings.matcher_embeddings_path, encoder)
@@ -0,0 +1,78 @@
+# src/boardgamefinder/services/match_memo.py
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from ..adapters.sqlite_cache import SqliteCache
+
+
+class MatchMemo:
+    """
+    Bounded LRU memo of match outcomes keyed by (name, llm_lang), storing the
+    matched BGG ID or None for names that did not match.
+
+    With a persistent `cache`, outcomes also survive across runs. Persistent keys
+    include `namespace`, a fingerprint of everything that can change an outcome
+    (dataset version, prompts, matcher settings), so entries from an older dataset
+    or prompt are simply never looked up again and age out of the cache.
+    Safe to share between threads.
+    """
+
+    def __init__(self, max_entries: int, namespace: str = "", cache: Optional[SqliteCache] = None):
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], Optional[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cache_key(self, key: Tuple[str, str]) -> str:
+        return SqliteCache.make_key(self.namespace, *key)
+
+    def get(self, name: str, llm_lang: str) -> Tuple[bool, Optional[int]]:
+        """Returns (found, bgg_id); `bgg_id` is None for a remembered non-match."""
+        key = (name, llm_lang)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+
+        if self.cache is not None:
+            value = self.cache.get(self._cache_key(key))
+            if value is not None:
+                bgg_id = json.loads(value)["id"]
+                self._remember(key, bgg_id)
+                with self._lock:
+                    self.hits += 1
+                return True, bgg_id
+
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def set(self, name: str, llm_lang: str, bgg_id: Optional[int]) -> None:
+        key = (name, llm_lang)
+        self._remember(key, bgg_id)
+        if self.cache is not None:
+            self.cache.set(self._cache_key(key), json.dumps({"id": bgg_id}))
+
+    def _remember(self, key: Tuple[str, str], bgg_id: Optional[int]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = bgg_id
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+        }
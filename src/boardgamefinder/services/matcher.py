@@ -1,14 +1,23 @@
 # src/boardgamefinder/services/matcher.py
-import difflib
+import hashlib
+import json
 import re
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
-import pandas as pd
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
-from ..adapters.bgg_repository import BGGRepository
+from ..adapters.bgg_repository import NORM_NAME_COL, BGGRepository
 from ..adapters.llm_client import LLM, Message
+from ..adapters.sqlite_cache import SqliteCache
+from ..config import settings
 from ..domain.models import BGGData
-from ..prompts import MATCHER_SYSTEM_PROMPT
+from ..instrumentation import timed
+from ..prompts import MATCHER_BATCH_SYSTEM_PROMPT, MATCHER_SYSTEM_PROMPT
+from .alias_index import AliasIndex, get_alias_index
+from .embedding_retriever import EmbeddingRetriever, get_embedding_retriever
+from .match_memo import MatchMemo
+from .name_index import NameIndex, RapidFuzzIndex, TrigramIndex, rapidfuzz_available
 
 
 def _normalize_name(s: str) -> str:
@@ -19,157 +28,522 @@ def _normalize_name(s: str) -> str:
     return s.strip()
 
 
+class BGGRecord(NamedTuple):
+    """Compact, DataFrame-free view of a single BGG row."""
+    id: int
+    name: str
+    year_published: Optional[int]
+    weight: Optional[float]
+    rating: Optional[float]
+    image_path: Optional[str]
+
+    def to_bgg_data(self) -> BGGData:
+        return BGGData(
+            id=self.id,
+            link=f"https://boardgamegeek.com/boardgame/{self.id}",
+            name=self.name,
+            year_published=self.year_published,
+            weight=self.weight,
+            rating=self.rating,
+            image_path=self.image_path,
+        )
+
+
 class NameMatcher(ABC):
-    """Abstract interface for matching a name to a BGG game entry."""
+    """
+    Abstract interface for matching a name to a BGG game entry.
+
+    `scorer` selects the fuzzy search backend: "trigram" (pure Python/numpy),
+    "rapidfuzz" (C-level scoring, requires the optional package) or "auto" (rapidfuzz
+    when installed). It defaults to the `matcher_scorer` setting.
+
+    Outcomes of `match`, including non-matches, are memoized per (name, llm_lang)
+    in an LRU of `memo_size` entries, optionally backed by a persistent
+    `memo_cache` that is keyed by `fingerprint()`.
+    Subclasses implement `_match`.
+    """
 
-    def __init__(self, repository: BGGRepository):
+    def __init__(
+        self,
+        repository: BGGRepository,
+        scorer: Optional[str] = None,
+        memo_size: int = 0,
+        memo_cache: Optional[SqliteCache] = None,
+    ):
+        self.scorer = scorer or settings.matcher_scorer
+        self.stats: Counter = Counter()  # How each name was decided
+        self._repository = repository
+        self._memo_size = memo_size
+        self._memo_cache = memo_cache
+        self._memo: Optional[MatchMemo] = None
+        self._memo_lock = threading.Lock()
+        self._stats_lock = threading.Lock()  # Matching runs on the pipeline's worker threads
         self.df = repository.get_all_games()
-        # Pre-filter out entries without a name
-        self.df = self.df[self.df["Name"].notna()].copy()
+        # Pre-filter out entries without a name; skipped when there are none, as it copies every column
+        has_name = self.df["Name"].notna()
+        if not has_name.all():
+            self.df = self.df[has_name].reset_index(drop=True)
+
+        self._names = self.df["Name"].astype(str).tolist()
+        if NORM_NAME_COL in self.df.columns:
+            # Snapshots ship names already normalized
+            self._norm_names = self.df[NORM_NAME_COL].astype(str).tolist()
+        else:
+            self._norm_names = [_normalize_name(n) for n in self._names]
+        self._ids = self.df["BGGId"].astype(int).tolist()
+
+        # Lookup tables so matching never has to rescan the DataFrame
+        self._rows_by_name: Dict[str, List[int]] = {}
+        for pos, norm_name in enumerate(self._norm_names):
+            self._rows_by_name.setdefault(norm_name, []).append(pos)
+        self._unique_norm_names = list(self._rows_by_name)
+        self._precomputed_index = repository.get_name_index_arrays()
+
+        self._records: Dict[int, BGGRecord] = {}
+        columns = zip(
+            self._ids,
+            self._names,
+            self._column_values("YearPublished"),
+            self._column_values("GameWeight"),
+            self._column_values("AvgRating"),
+            self._column_values("ImagePath"),
+        )
+        for bgg_id, name, year, weight, rating, image in columns:
+            self._records[bgg_id] = BGGRecord(
+                id=bgg_id,
+                name=name,
+                year_published=int(year) if year is not None else None,
+                weight=float(weight) if weight is not None else None,
+                rating=float(rating) if rating is not None else None,
+                image_path=image,
+            )
+
+    def _column_values(self, column: str) -> list:
+        """Returns a DataFrame column as a Python list, with missing values as None."""
+        values = self.df[column]
+        return values.astype(object).where(values.notna(), None).tolist()
+
+    def _build_name_index(self) -> NameIndex:
+        """Returns a name index over the unique normalized names for the configured scorer."""
+        if self.scorer == "rapidfuzz" or (self.scorer == "auto" and rapidfuzz_available()):
+            return RapidFuzzIndex(self._unique_norm_names)
+        if self.scorer not in ("auto", "trigram"):
+            raise ValueError(f"Unknown matcher scorer: {self.scorer}")
+
+        # Reuse a precomputed trigram index if it was built over the same names
+        arrays = self._precomputed_index
+        if arrays is not None and arrays["names"].tolist() == self._unique_norm_names:
+            return TrigramIndex.from_arrays(self._unique_norm_names, arrays)
+        return TrigramIndex(self._unique_norm_names)
+
+    def _records_for_name(self, norm_name: str) -> List[BGGRecord]:
+        """Returns all BGG records whose normalized name equals `norm_name`."""
+        return [self._records[self._ids[pos]] for pos in self._rows_by_name.get(norm_name, [])]
+
+    def fingerprint(self) -> Dict[str, object]:
+        """
+        Everything besides the input that determines a match outcome, e.g. to key
+        cached or evaluated results; includes the dataset version.
+        """
+        return {
+            "matcher": type(self).__name__,
+            "scorer": self.scorer,
+            "dataset": self._repository.get_version(),
+        }
+
+    def _record_decision(self, decision: str) -> None:
+        """Counts how a name was decided in `stats`."""
+        with self._stats_lock:
+            self.stats[decision] += 1
+
+    def _get_memo(self) -> Optional[MatchMemo]:
+        """Returns the match memo, creating it on first use; None if memoization is off."""
+        if self._memo_size <= 0 and self._memo_cache is None:
+            return None
+        with self._memo_lock:
+            if self._memo is None:
+                # The fingerprint only matters for (and may be costly without) a persistent cache
+                namespace = ""
+                if self._memo_cache is not None:
+                    namespace = SqliteCache.make_key(self.fingerprint())
+                self._memo = MatchMemo(self._memo_size, namespace=namespace, cache=self._memo_cache)
+            return self._memo
+
+    def _recall(self, name: str, llm_lang: str) -> Tuple[bool, Optional[BGGData]]:
+        """Looks up a memoized outcome; returns (found, match)."""
+        memo = self._get_memo()
+        if memo is None:
+            return False, None
+        found, bgg_id = memo.get(name, llm_lang)
+        if not found:
+            return False, None
+        if bgg_id is None:
+            self._record_decision("memo")
+            return True, None
+        record = self._records.get(bgg_id)
+        if record is None:
+            return False, None  # Not in the current data; match again
+        self._record_decision("memo")
+        return True, record.to_bgg_data()
+
+    def _remember(self, name: str, llm_lang: str, result: Optional[BGGData]) -> None:
+        memo = self._get_memo()
+        if memo is not None:
+            memo.set(name, llm_lang, result.id if result else None)
+
+    def memo_stats(self) -> Optional[Dict[str, object]]:
+        """Returns hit/miss counters of the match memo, or None if memoization is off."""
+        memo = self._get_memo()
+        return memo.stats() if memo is not None else None
 
-    @abstractmethod
     def match(self, name: str, llm_lang: str) -> Optional[BGGData]:
+        """Matches a single name, reusing a memoized outcome when there is one."""
+        if not name:
+            return None
+        found, result = self._recall(name, llm_lang)
+        if found:
+            return result
+        result = self._match(name, llm_lang)
+        self._remember(name, llm_lang, result)
+        return result
+
+    @abstractmethod
+    def _match(self, name: str, llm_lang: str) -> Optional[BGGData]:
         ...
 
+    def match_many(self, items: Sequence[Tuple[str, str]]) -> List[Optional[BGGData]]:
+        """Matches several (name, llm_lang) pairs, returning results in input order."""
+        return [self.match(name, llm_lang) for name, llm_lang in items]
+
 
 class FuzzyNameMatcher(NameMatcher):
     """Matches names using a fuzzy string matching algorithm."""
 
-    def __init__(self, repository: BGGRepository, cutoff: float = 0.7):
-        super().__init__(repository)
+    def __init__(self, repository: BGGRepository, cutoff: float = 0.7, **kwargs):
+        super().__init__(repository, **kwargs)
         self.cutoff = cutoff
-        self._names = self.df["Name"].astype(str).tolist()
-        self._norm_names = [_normalize_name(n) for n in self._names]
+        self._index = self._build_name_index()
         print(f"FuzzyNameMatcher initialized with {len(self._names)} BGG entries.")
 
-    def match(self, name: str, llm_lang: str) -> Optional[BGGData]:
-        if not name:
-            return None
+    def fingerprint(self) -> Dict[str, object]:
+        return {**super().fingerprint(), "cutoff": self.cutoff}
 
+    def _match(self, name: str, llm_lang: str) -> Optional[BGGData]:
         norm_query = _normalize_name(name)
-        best_matches = difflib.get_close_matches(
-            norm_query, self._norm_names, n=1, cutoff=self.cutoff
-        )
+        best_matches = self._index.search(norm_query, n=1, cutoff=self.cutoff)
 
         if not best_matches:
             return None
 
-        best_norm = best_matches[0]
-        idx = self._norm_names.index(best_norm)
-        row = self.df.iloc[idx]
-
-        print(f"Matched '{name}' -> '{row['Name']}' (BGGId: {row['BGGId']})")
-
-        return BGGData(
-            id=int(row["BGGId"]),
-            link=f"https://boardgamegeek.com/boardgame/{row['BGGId']}",
-            name=row["Name"],
-            year_published=(
-                int(row["YearPublished"]) if pd.notna(row["YearPublished"]) else None
-            ),
-            weight=float(row["GameWeight"]) if pd.notna(row["GameWeight"]) else None,
-            rating=float(row["AvgRating"]) if pd.notna(row["AvgRating"]) else None,
-            image_path=row["ImagePath"] if pd.notna(row["ImagePath"]) else None,
-        )
+        record = self._records_for_name(self._unique_norm_names[best_matches[0][0]])[0]
+        print(f"Matched '{name}' -> '{record.name}' (BGGId: {record.id})")
+        return record.to_bgg_data()
 
 
 class LLMNameMatcher(NameMatcher):
     """
     Matches names using a two-step fuzzy search combined with an LLM call
     to select the best candidate.
+
+    With `fast_path` enabled, unambiguous names skip the LLM: a name whose
+    normalized form equals exactly one BGG entry, or whose best fuzzy score is at
+    least `fast_path_min_score` and beats the runner-up by `fast_path_min_margin`.
+
+    Names found in the optional `aliases` table (known past matches) are resolved
+    before anything else.
+
+    An optional `retriever` adds the `num_embedding_candidates` semantically
+    closest names to the fuzzy candidates, which catches translated titles.
     """
 
     def __init__(
-        self, repository: BGGRepository, llm_client: LLM, num_candidates: int = 20
+        self,
+        repository: BGGRepository,
+        llm_client: LLM,
+        num_candidates: int = 20,
+        fast_path: bool = False,
+        fast_path_min_score: float = 0.95,
+        fast_path_min_margin: float = 0.1,
+        retriever: Optional[EmbeddingRetriever] = None,
+        num_embedding_candidates: int = 10,
+        aliases: Optional[AliasIndex] = None,
+        **kwargs,
     ):
-        super().__init__(repository)
+        super().__init__(repository, **kwargs)
+        self.aliases = aliases
         self.llm_client = llm_client
         self.num_candidates = num_candidates
-        self._names = self.df["Name"].astype(str).tolist()
-        self._norm_names = [_normalize_name(n) for n in self._names]
+        self.retriever = retriever
+        self.num_embedding_candidates = num_embedding_candidates
+        self.fast_path = fast_path
+        self.fast_path_min_score = fast_path_min_score
+        self.fast_path_min_margin = fast_path_min_margin
+        self._index = self._build_name_index()
         print(f"LLMNameMatcher initialized with {len(self._names)} BGG entries.")
 
-    def _get_fuzzy_candidates(self, normalized_query: str) -> pd.DataFrame:
-        """Finds top N fuzzy matches and returns them as a DataFrame."""
-        matches = difflib.get_close_matches(
-            normalized_query, self._norm_names, n=self.num_candidates, cutoff=0.6
-        )
-        if not matches:
-            return pd.DataFrame()
+    def fingerprint(self) -> Dict[str, object]:
+        prompts = MATCHER_SYSTEM_PROMPT + MATCHER_BATCH_SYSTEM_PROMPT
+        return {
+            **super().fingerprint(),
+            "prompts": hashlib.sha256(prompts.encode("utf-8")).hexdigest(),
+            "model": getattr(self.llm_client, "model", type(self.llm_client).__name__),
+            "num_candidates": self.num_candidates,
+            "fast_path": [self.fast_path, self.fast_path_min_score, self.fast_path_min_margin],
+            "aliases": self.aliases.fingerprint() if self.aliases is not None else None,
+            "retriever": [len(self.retriever), self.num_embedding_candidates] if self.retriever else None,
+        }
+
+    def _alias_match(self, name: str, llm_lang: str) -> Optional[BGGData]:
+        """Returns the known match for `name` from the alias table, if any."""
+        if self.aliases is None:
+            return None
+        bgg_id = self.aliases.get(_normalize_name(name), llm_lang)
+        record = self._records.get(bgg_id) if bgg_id is not None else None
+        if record is None:
+            return None  # No alias, or its game is not in the current BGG data
 
-        indices = [self._norm_names.index(match) for match in matches]
-        return self.df.iloc[indices].copy()
+        self._record_decision("alias")
+        print(f"Alias matched '{name}' -> '{record.name}' (BGGId: {record.id})")
+        return record.to_bgg_data()
 
-    def _format_candidates_for_prompt(self, candidates_df: pd.DataFrame) -> str:
-        """Formats a DataFrame of candidates into a list string for the LLM prompt."""
-        if candidates_df.empty:
+    def _fast_match(self, name: str) -> Optional[BGGData]:
+        """Returns the match for `name` if it is unambiguous without asking the LLM."""
+        norm_query = _normalize_name(name)
+        exact = self._records_for_name(norm_query)
+        if len(exact) == 1:
+            record = exact[0]
+        elif exact:
+            return None  # Several BGG entries share this name
+        else:
+            # The runner-up may score below the threshold but still be too close
+            top = self._index.search(
+                norm_query, n=2, cutoff=max(0.0, self.fast_path_min_score - self.fast_path_min_margin)
+            )
+            if not top or top[0][1] < self.fast_path_min_score:
+                return None
+            if len(top) == 2 and top[0][1] - top[1][1] < self.fast_path_min_margin:
+                return None
+            records = self._records_for_name(self._unique_norm_names[top[0][0]])
+            if len(records) != 1:
+                return None
+            record = records[0]
+
+        self._record_decision("fast_path")
+        print(f"Fast-path matched '{name}' -> '{record.name}' (BGGId: {record.id})")
+        return record.to_bgg_data()
+
+    def _records_for_matches(self, matches: List[Tuple[int, float]]) -> List[BGGRecord]:
+        """Returns every record carrying one of the matched names, best match first."""
+        candidates: List[BGGRecord] = []
+        for pos, _ in matches:
+            candidates.extend(self._records_for_name(self._unique_norm_names[pos]))
+        return candidates
+
+    def _format_candidates_for_prompt(self, candidates: List[BGGRecord]) -> str:
+        """Formats a list of candidate records into a list string for the LLM prompt."""
+        if not candidates:
             return "No candidates found."
 
-        return "\n".join(
-            [f"- ID: {row['BGGId']}, Name: {row['Name']}" for _, row in candidates_df.iterrows()]
+        return "\n".join(f"- ID: {c.id}, Name: {c.name}" for c in candidates)
+
+    @timed("match.candidates")
+    def _get_candidates(self, name: str) -> List[BGGRecord]:
+        """Fuzzy-searches on the base name and the full name and returns the deduplicated candidates."""
+        base_name = name.split(":")[0].strip()
+        matches_base, matches_full = self._index.search_many(
+            [_normalize_name(base_name), _normalize_name(name)], n=self.num_candidates, cutoff=0.6
         )
+        candidates_base = self._records_for_matches(matches_base)
+        candidates_full = self._records_for_matches(matches_full)
 
-    def match(self, name: str, llm_lang: str) -> Optional[BGGData]:
-        if not name:
+        candidates_semantic: List[BGGRecord] = []
+        if self.retriever is not None:
+            for pos, _ in self.retriever.search(
+                _normalize_name(name), n=self.num_embedding_candidates
+            ):
+                candidates_semantic.extend(self._records_for_name(self.retriever.names[pos]))
+
+        # Combine and deduplicate candidates
+        return list({c.id: c for c in candidates_full + candidates_base + candidates_semantic}.values())
+
+    def _resolve_id(self, name: str, answer: str) -> Optional[BGGData]:
+        """Turns the LLM's answer for `name` into BGG data; None for "None" or invalid IDs."""
+        if answer.lower() == "none" or not answer.isdigit():
             return None
 
-        # Step 1: Perform fuzzy search on base name and full name
-        base_name = name.split(":")[0].strip()
-        candidates_base = self._get_fuzzy_candidates(_normalize_name(base_name))
-        candidates_full = self._get_fuzzy_candidates(_normalize_name(name))
+        record = self._records.get(int(answer))
+        if record is None:
+            print(f"Warning: LLM returned an invalid BGG ID '{answer}'.")
+            return None
 
-        # Combine and deduplicate candidates
-        all_candidates = (
-            pd.concat([candidates_full, candidates_base])
-            .drop_duplicates(subset=["BGGId"])
-            .reset_index(drop=True)
-        )
+        print(f"Matched '{name}' -> '{record.name}' (BGGId: {record.id})")
+        return record.to_bgg_data()
+
+    def _format_game_for_prompt(self, name: str, llm_lang: str, candidates: List[BGGRecord]) -> str:
+        prompt_candidates = self._format_candidates_for_prompt(candidates)
+        return f'Original game name: "{name}"\nllm_lang: "{llm_lang}"\n\nCandidate games:\n{prompt_candidates}'
+
+    def _match(self, name: str, llm_lang: str) -> Optional[BGGData]:
+        known_match = self._alias_match(name, llm_lang)
+        if known_match:
+            return known_match
 
-        if all_candidates.empty:
+        if self.fast_path:
+            fast_match = self._fast_match(name)
+            if fast_match:
+                return fast_match
+
+        # Step 1: Perform fuzzy search on base name and full name
+        all_candidates = self._get_candidates(name)
+
+        if not all_candidates:
             print(f"No fuzzy candidates found for '{name}'.")
             return None
 
         # print(f"\n--- Debugging Candidates for '{name}' ---")
         # print(f"Found {len(all_candidates)} unique candidates:")
-        # for _, row in all_candidates.iterrows():
-        #     print(f"  - ID: {row['BGGId']}, Name: {row['Name']}")
+        # for c in all_candidates:
+        #     print(f"  - ID: {c.id}, Name: {c.name}")
         # print("------------------------------------------")
 
+        return self._choose_candidate(name, llm_lang, all_candidates)
+
+    def _choose_candidate(self, name: str, llm_lang: str, candidates: List[BGGRecord]) -> Optional[BGGData]:
+        """Asks the LLM to pick the match for a single name among its candidates."""
         # Step 2: Call LLM to select the best candidate
-        prompt_candidates = self._format_candidates_for_prompt(all_candidates)
-        user_prompt = f'Original game name: "{name}"\nllm_lang: "{llm_lang}"\n\nCandidate games:\n{prompt_candidates}'
+        self._record_decision("llm")
         messages = [
             Message("system", MATCHER_SYSTEM_PROMPT),
-            Message("user", user_prompt),
+            Message("user", self._format_game_for_prompt(name, llm_lang, candidates)),
         ]
         llm_response = self.llm_client.get_response(messages, temperature=0.0)
 
         # Step 3: Parse LLM response and return the BGGData object
         response_text = llm_response.strip()
         print(f"LLM decision for '{name}': '{response_text}'")
+        return self._resolve_id(name, response_text)
 
-        if response_text.lower() == "none" or not response_text.isdigit():
+    def _parse_batch_response(self, raw_message: str) -> Optional[Dict[str, object]]:
+        """Safely parses the JSON object of a batched matcher response."""
+        start = raw_message.find("{")
+        end = raw_message.rfind("}") + 1
+        if start == -1 or end == 0:
             return None
-
         try:
-            best_id = int(response_text)
-            match_row = self.df[self.df["BGGId"] == best_id].iloc[0]
-
-            print(f"Matched '{name}' -> '{match_row['Name']}' (BGGId: {match_row['BGGId']})")
-
-            return BGGData(
-                id=int(match_row["BGGId"]),
-                link=f"https://boardgamegeek.com/boardgame/{match_row['BGGId']}",
-                name=match_row["Name"],
-                year_published=(
-                    int(match_row["YearPublished"])
-                    if pd.notna(match_row["YearPublished"])
-                    else None
-                ),
-                weight=float(match_row["GameWeight"]) if pd.notna(match_row["GameWeight"]) else None,
-                rating=float(match_row["AvgRating"]) if pd.notna(match_row["AvgRating"]) else None,
-                image_path=match_row["ImagePath"] if pd.notna(match_row["ImagePath"]) else None,
-            )
-        except (ValueError, IndexError):
-            print(f"Warning: LLM returned an invalid BGG ID '{response_text}'.")
-            return None
\ No newline at end of file
+            parsed = json.loads(raw_message[start:end])
+        except json.JSONDecodeError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    def match_many(self, items: Sequence[Tuple[str, str]]) -> List[Optional[BGGData]]:
+        """
+        Matches all games of a listing with a single LLM call. Memoized and
+        repeated (name, llm_lang) pairs are only matched once.
+        """
+        results: List[Optional[BGGData]] = [None] * len(items)
+        pending: Dict[Tuple[str, str], List[int]] = {}  # Pairs still to match -> indices in items
+        for i, (name, llm_lang) in enumerate(items):
+            if not name:
+                continue
+            found, results[i] = self._recall(name, llm_lang)
+            if not found:
+                pending.setdefault((name, llm_lang), []).append(i)
+
+        for pair, result in zip(pending, self._match_batch(list(pending))):
+            self._remember(*pair, result)
+            for i in pending[pair]:
+                results[i] = result
+        return results
+
+    def _match_batch(self, items: Sequence[Tuple[str, str]]) -> List[Optional[BGGData]]:
+        """
+        Matches non-empty (name, llm_lang) pairs with a single LLM call. Games whose
+        answer is missing, malformed or not one of their own candidates fall back to
+        a single-game prompt over the same candidates.
+        """
+        results: List[Optional[BGGData]] = [None] * len(items)
+        # Game number in the prompt -> (index in items, its candidates)
+        blocks: Dict[str, Tuple[int, List[BGGRecord]]] = {}
+        sections = []
+        for i, (name, llm_lang) in enumerate(items):
+            results[i] = self._alias_match(name, llm_lang)
+            if results[i]:
+                continue
+            if self.fast_path:
+                results[i] = self._fast_match(name)
+                if results[i]:
+                    continue
+            candidates = self._get_candidates(name)
+            if not candidates:
+                print(f"No fuzzy candidates found for '{name}'.")
+                continue
+            number = str(len(blocks) + 1)
+            blocks[number] = (i, candidates)
+            sections.append(f"Game {number}:\n{self._format_game_for_prompt(name, llm_lang, candidates)}")
+
+        if len(blocks) <= 1:
+            # Nothing to batch; keep the single-game prompt
+            for i, candidates in blocks.values():
+                results[i] = self._choose_candidate(*items[i], candidates)
+            return results
+
+        self._record_decision("llm_batch")
+        messages = [
+            Message("system", MATCHER_BATCH_SYSTEM_PROMPT),
+            Message("user", "\n\n".join(sections)),
+        ]
+        llm_response = self.llm_client.get_response(messages, temperature=0.0)
+        answers = self._parse_batch_response(llm_response)
+        if answers is None:
+            print(f"Warning: Failed to parse batched matcher response: {llm_response}")
+            answers = {}
+
+        for number, (i, candidates) in blocks.items():
+            name, llm_lang = items[i]
+            answer = answers.get(number, "")
+            if answer is None:
+                print(f"LLM decision for '{name}': 'None'")
+                continue
+            answer = str(answer).strip()
+            if answer.isdigit() and int(answer) not in {c.id for c in candidates}:
+                # E.g. another game's candidate; don't trust a mixed-up answer
+                print(f"Warning: Batched answer '{answer}' for '{name}' is not one of its candidates.")
+                answer = ""
+            if not (answer.isdigit() or answer.lower() == "none"):
+                print(f"Warning: No usable batched answer for '{name}', matching it on its own.")
+                results[i] = self._choose_candidate(name, llm_lang, candidates)
+                continue
+            print(f"LLM decision for '{name}': '{answer}'")
+            results[i] = self._resolve_id(name, answer)
+        return results
+
+
+def get_name_matcher(repository: BGGRepository, llm_client: LLM) -> NameMatcher:
+    """Factory function to create a NameMatcher based on app settings."""
+    memo_cache = None
+    if settings.matcher_memo_cache_enabled:
+        memo_cache = SqliteCache(
+            settings.matcher_memo_cache_path,
+            table="match_results",
+            max_entries=settings.matcher_memo_size * 10,
+            max_age_seconds=settings.matcher_memo_cache_max_age_days * 86400,
+        )
+    memo = {"memo_size": settings.matcher_memo_size, "memo_cache": memo_cache}
+
+    method = settings.matching_method
+    if method == "llm":
+        return LLMNameMatcher(
+            repository=repository,
+            llm_client=llm_client,
+            fast_path=settings.matcher_fast_path,
+            fast_path_min_score=settings.matcher_fast_path_min_score,
+            fast_path_min_margin=settings.matcher_fast_path_min_margin,
+            retriever=get_embedding_retriever(),
+            num_embedding_candidates=settings.matcher_embedding_candidates,
+            aliases=get_alias_index(),
+            **memo,
+        )
+    elif method == "fuzzy":
+        return FuzzyNameMatcher(repository=repository, **memo)
+    else:
+        raise ValueError(f"Unknown matching method: {method}")
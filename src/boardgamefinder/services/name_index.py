@@ -0,0 +1,233 @@
+# src/boardgamefinder/services/name_index.py
+import difflib
+import heapq
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from itertools import chain
+from typing import Dict, List, Mapping, Sequence, Set, Tuple
+
+import numpy as np
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is optional; the trigram index needs only numpy
+    fuzz = process = None
+
+
+def rapidfuzz_available() -> bool:
+    return process is not None
+
+
+def _trigrams(s: str) -> Set[str]:
+    """Returns the set of character trigrams of a space-padded string."""
+    padded = f" {s} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex(ABC):
+    """Nearest-name lookup over a fixed list of (normalized) names."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def search(self, query: str, n: int, cutoff: float = 0.6) -> List[Tuple[int, float]]:
+        """
+        Returns up to `n` (position, score) pairs with a score of at least `cutoff`,
+        best first. Positions refer to the list of names the index was built from,
+        and scores are similarity ratios between 0 and 1.
+        """
+        ...
+
+    def search_many(
+        self, queries: Sequence[str], n: int, cutoff: float = 0.6
+    ) -> List[List[Tuple[int, float]]]:
+        """Runs `search` for every query, returning the results in input order."""
+        return [self.search(query, n, cutoff) for query in queries]
+
+
+class TrigramIndex(NameIndex):
+    """
+    Character-trigram inverted index over a fixed list of (normalized) names.
+
+    Lookups first pre-score every name sharing a trigram with the query using the
+    Dice coefficient, then rescore the best of those with the same ratio that
+    `difflib.get_close_matches` uses, so results are directly comparable to it.
+
+    Postings are kept as flat numpy arrays (CSR layout), so an index can be saved
+    with `to_arrays` and reloaded, e.g. memory-mapped, with `from_arrays`.
+    """
+
+    def __init__(self, names: Sequence[str], pool_size: int = 500):
+        postings: Dict[str, List[int]] = defaultdict(list)
+        gram_counts: List[int] = []
+        for pos, name in enumerate(names):
+            grams = _trigrams(name)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings[gram].append(pos)
+
+        grams = sorted(postings)
+        offsets = np.zeros(len(grams) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(postings[g]) for g in grams])
+        flat = np.fromiter(
+            chain.from_iterable(postings[g] for g in grams), dtype=np.int32, count=int(offsets[-1])
+        )
+        self._load(
+            list(names),
+            np.array(grams, dtype="<U3"),
+            offsets,
+            flat,
+            np.array(gram_counts, dtype=np.int32),
+            pool_size,
+        )
+
+    def _load(
+        self,
+        names: List[str],
+        grams: np.ndarray,
+        offsets: np.ndarray,
+        postings: np.ndarray,
+        gram_counts: np.ndarray,
+        pool_size: int,
+    ) -> None:
+        self._names = names
+        self.pool_size = pool_size
+        self._grams = grams
+        self._gram_ids = {gram: i for i, gram in enumerate(grams.tolist())}
+        self._offsets = offsets
+        self._postings = postings
+        self._gram_counts = gram_counts
+
+    @classmethod
+    def from_arrays(
+        cls, names: Sequence[str], arrays: Mapping[str, np.ndarray], pool_size: int = 500
+    ) -> "TrigramIndex":
+        """Rebuilds an index from the output of `to_arrays` without re-tokenizing names."""
+        index = cls.__new__(cls)
+        index._load(
+            list(names),
+            arrays["grams"],
+            arrays["offsets"],
+            arrays["postings"],
+            arrays["gram_counts"],
+            pool_size,
+        )
+        return index
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Returns the index structures as plain numpy arrays, suitable for `np.save`."""
+        return {
+            "names": np.array(self._names, dtype=str),
+            "grams": self._grams,
+            "offsets": self._offsets,
+            "postings": self._postings,
+            "gram_counts": self._gram_counts,
+        }
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def search(self, query: str, n: int, cutoff: float = 0.6) -> List[Tuple[int, float]]:
+        if not query or n <= 0:
+            return []
+
+        query_grams = _trigrams(query)
+        slices = [
+            self._postings[self._offsets[i]:self._offsets[i + 1]]
+            for i in (self._gram_ids.get(gram) for gram in query_grams)
+            if i is not None
+        ]
+        if not slices:
+            return []
+
+        # Cheap pre-score: Dice coefficient on trigram sets
+        shared = np.bincount(np.concatenate(slices), minlength=len(self._names))
+        candidates = np.flatnonzero(shared)
+        dice = 2.0 * shared[candidates] / (len(query_grams) + self._gram_counts[candidates])
+        pool_size = max(self.pool_size, n)
+        if len(candidates) > pool_size:
+            candidates = candidates[np.argpartition(-dice, pool_size - 1)[:pool_size]]
+
+        # Exact rescoring, mirroring difflib.get_close_matches
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(query)
+        scored: List[Tuple[float, str, int]] = []
+        for pos in candidates.tolist():
+            name = self._names[pos]
+            matcher.set_seq1(name)
+            if (
+                matcher.real_quick_ratio() >= cutoff
+                and matcher.quick_ratio() >= cutoff
+                and matcher.ratio() >= cutoff
+            ):
+                scored.append((matcher.ratio(), name, pos))
+
+        best = heapq.nlargest(n, scored)
+        return [(pos, score) for score, _, pos in best]
+
+
+class RapidFuzzIndex(NameIndex):
+    """
+    Scores the query against every name with rapidfuzz's C implementation of the
+    Indel ratio, which equals difflib's ratio whenever difflib finds the longest
+    common subsequence (and is never lower). `search_many` scores a whole batch
+    of queries in one `cdist` call.
+
+    Requires the optional `rapidfuzz` package.
+    """
+
+    _CDIST_CHUNK = 64  # Queries per cdist call, bounding the score matrix size
+
+    def __init__(self, names: Sequence[str], workers: int = 1):
+        if process is None:
+            raise ImportError("RapidFuzzIndex requires the 'rapidfuzz' package.")
+        self._names = list(names)
+        self.workers = workers
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def search(self, query: str, n: int, cutoff: float = 0.6) -> List[Tuple[int, float]]:
+        if not query or n <= 0:
+            return []
+
+        best = process.extract(
+            query,
+            self._names,
+            scorer=fuzz.ratio,
+            processor=None,
+            limit=n,
+            score_cutoff=cutoff * 100,
+        )
+        return [(pos, score / 100) for _, score, pos in best]
+
+    def search_many(
+        self, queries: Sequence[str], n: int, cutoff: float = 0.6
+    ) -> List[List[Tuple[int, float]]]:
+        results: List[List[Tuple[int, float]]] = []
+        for start in range(0, len(queries), self._CDIST_CHUNK):
+            chunk = list(queries[start:start + self._CDIST_CHUNK])
+            scores = process.cdist(
+                chunk,
+                self._names,
+                scorer=fuzz.ratio,
+                processor=None,
+                score_cutoff=cutoff * 100,
+                dtype=np.float64,
+                workers=self.workers,
+            )
+            for query, row in zip(chunk, scores):
+                if not query or n <= 0:
+                    results.append([])
+                    continue
+                top = np.flatnonzero(row)  # Scores below the cutoff are 0
+                if len(top) > n:
+                    # Keep everything tied with the n-th best score so ties resolve below
+                    nth_best = -np.partition(-row[top], n - 1)[n - 1]
+                    top = top[row[top] >= nth_best]
+                # Best first; ties in position order, like `process.extract`
+                top = top[np.lexsort((top, -row[top]))][:n]
+                results.append([(int(pos), float(row[pos]) / 100) for pos in top])
+        return results
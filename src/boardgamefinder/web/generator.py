@@ -1,16 +1,30 @@
 # src/boardgamefinder/web/generator.py
+import json
 import os
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone, timedelta
 from jinja2 import Environment, FileSystemLoader, select_autoescape
+from pydantic import TypeAdapter
 import zoneinfo
 
 from ..adapters.firestore_repository import ListingRepository
 from ..config import settings
+from ..domain.models import Game
+from ..instrumentation import timed
 
 # Define the local timezone for accurate UTC conversion and display
 LOCAL_TIMEZONE = zoneinfo.ZoneInfo("Europe/Amsterdam")
 
+# Listings are shown for this many days after they were first saved
+WINDOW_DAYS = 30
+# Version of the on-disk site state; bump when its layout changes
+_STATE_VERSION = 1
+# Overlap between incremental builds, to tolerate clock skew between writers
+_INCREMENTAL_OVERLAP = timedelta(minutes=5)
+# The only listing fields the site needs; everything else is left in Firestore
+_SITE_FIELDS = ["link", "created_at", "games"]
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
 class WebGenerator:
     """Generates the static website from Firestore data."""
 
@@ -32,43 +46,123 @@ class WebGenerator:
         # If already aware, just convert to UTC for consistency
         return dt.astimezone(timezone.utc)
 
-    def generate_site(self):
-        """Fetches data, renders HTML, and saves it to the output directory."""
+    def _summarize_listing(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduces a projected listing document to what the site state stores."""
+        created_at = _DATETIME_ADAPTER.validate_python(doc["created_at"])
+        games = [Game.model_validate(g) for g in doc.get("games") or []]
+        return {
+            "created_at": self._get_aware_utc_datetime(created_at).isoformat(),
+            "games": [
+                {
+                    "id": game.bgg_data.id,
+                    "name": game.bgg_data.name,
+                    "rating": game.bgg_data.rating,
+                    "weight": game.bgg_data.weight,
+                    "year": game.bgg_data.year_published,
+                    "bgg_link": str(game.bgg_data.link),
+                    "image": str(game.bgg_data.image_path) if game.bgg_data.image_path else "",
+                }
+                for game in games
+                if game.bgg_data
+            ],
+        }
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        """Loads the materialized listing view from the last build, if usable."""
+        try:
+            with open(settings.web_state_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("version") != _STATE_VERSION:
+            return None
+        return state
+
+    def _save_state(self, built_at: datetime, listings: Dict[str, Dict[str, Any]]) -> None:
+        state_dir = os.path.dirname(settings.web_state_path)
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+        state = {"version": _STATE_VERSION, "built_at": built_at.isoformat(), "listings": listings}
+        with open(settings.web_state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+    def _collect_listings(self, incremental: bool, built_at: datetime) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the summaries of all listings inside the display window, keyed by link.
+
+        In incremental mode only listings saved since the previous build are read
+        and merged into the stored view; otherwise all listings created inside the
+        window are read.
+        """
+        window_start = built_at - timedelta(days=WINDOW_DAYS)
+        state = self._load_state() if incremental else None
+
+        if state is None:
+            if incremental:
+                print("No usable site state found, doing a full rebuild...")
+            listings = {}
+            changed = self.repo.iter_created_since(window_start, fields=_SITE_FIELDS)
+        else:
+            listings = state["listings"]
+            since = datetime.fromisoformat(state["built_at"]) - _INCREMENTAL_OVERLAP
+            changed = self.repo.get_updated_since(since, fields=_SITE_FIELDS)
+            print(f"Applying {len(changed)} listings changed since {since.isoformat()}...")
+
+        for doc in changed:
+            try:
+                listings[doc["link"]] = self._summarize_listing(doc)
+            except Exception as e:
+                print(f"Skipping listing {doc.get('link')} that failed validation: {e}")
+
+        # Expire listings that fell out of the display window
+        return {
+            link: entry
+            for link, entry in listings.items()
+            if datetime.fromisoformat(entry["created_at"]) >= window_start
+        }
+
+    @timed("web.generate_site")
+    def generate_site(self, incremental: Optional[bool] = None):
+        """
+        Fetches data, renders HTML, and saves it to the output directory.
+
+        With `incremental` (defaults to `settings.web_incremental`), the listing
+        view from the previous build is updated with only the listings saved since
+        then. Listings deleted from Firestore are only dropped by a full rebuild.
+        """
         print("Starting website generation...")
-        all_listings = self.repo.get_all()
-        one_month_ago = datetime.now(timezone.utc) - timedelta(days=30)
+        if incremental is None:
+            incremental = settings.web_incremental
+        built_at = datetime.now(timezone.utc)
+        listings = self._collect_listings(incremental, built_at)
         games_map: Dict[int, Dict[str, Any]] = {}
 
-        for listing in all_listings:
+        for link, entry in listings.items():
             # USE created_at for all filtering and display logic
-            listing_creation_date_utc = self._get_aware_utc_datetime(listing.created_at)
-            
-            if listing_creation_date_utc < one_month_ago:
-                continue
-
-            for game in listing.games:
-                if game.bgg_data:
-                    bgg_id = game.bgg_data.id
-                    if not (settings.bgg_min_rating <= game.bgg_data.rating <= 10.0):
-                        continue
-                    if not (settings.bgg_min_weight <= game.bgg_data.weight <= settings.bgg_max_weight):
-                        continue
-
-                    if bgg_id not in games_map:
-                        games_map[bgg_id] = {
-                            "name": game.bgg_data.name,
-                            "rating": game.bgg_data.rating,
-                            "weight": game.bgg_data.weight,
-                            "year": game.bgg_data.year_published,
-                            "bgg_link": str(game.bgg_data.link),
-                            "image": str(game.bgg_data.image_path) if game.bgg_data.image_path else "",
-                            "listings": [],
-                        }
-                    
-                    games_map[bgg_id]["listings"].append({
-                        "link": str(listing.link),
-                        "date": listing_creation_date_utc, # Use the created_at timestamp
-                    })
+            listing_creation_date_utc = datetime.fromisoformat(entry["created_at"])
+
+            for game in entry["games"]:
+                bgg_id = game["id"]
+                if not (settings.bgg_min_rating <= game["rating"] <= 10.0):
+                    continue
+                if not (settings.bgg_min_weight <= game["weight"] <= settings.bgg_max_weight):
+                    continue
+
+                if bgg_id not in games_map:
+                    games_map[bgg_id] = {
+                        "name": game["name"],
+                        "rating": game["rating"],
+                        "weight": game["weight"],
+                        "year": game["year"],
+                        "bgg_link": game["bgg_link"],
+                        "image": game["image"],
+                        "listings": [],
+                    }
+
+                games_map[bgg_id]["listings"].append({
+                    "link": link,
+                    "date": listing_creation_date_utc, # Use the created_at timestamp
+                })
 
         # Process games after aggregation: sort listings, find newest, and format dates
         for game_id, game_data in games_map.items():
@@ -94,4 +188,6 @@ class WebGenerator:
         output_path = os.path.join(settings.web_output_dir, "index.html")
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(html_content)
-        print(f"✅ Website successfully generated at: {output_path}")
\ No newline at end of file
+        print(f"✅ Website successfully generated at: {output_path}")
+
+        self._save_state(built_at, listings)
\ No newline at end of file
@@ -0,0 +1,110 @@
+# tests/test_matcher.py
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from boardgamefinder.adapters.bgg_repository import COLS, BGGRepository
+from boardgamefinder.adapters.llm_client import LLM
+from boardgamefinder.services.matcher import LLMNameMatcher
+from boardgamefinder.services.name_index import rapidfuzz_available
+
+SCORERS = ["trigram", pytest.param("rapidfuzz", marks=pytest.mark.skipif(
+    not rapidfuzz_available(), reason="rapidfuzz is not installed"
+))]
+
+
+class _Repository(BGGRepository):
+    def __init__(self, names: List[str]):
+        self._df = pd.DataFrame({
+            "BGGId": range(1, len(names) + 1),
+            "Name": names,
+            "YearPublished": 2000,
+            "GameWeight": 2.0,
+            "AvgRating": 7.0,
+            "ImagePath": None,
+        })[COLS]
+
+    def get_all_games(self) -> pd.DataFrame:
+        return self._df
+
+
+@pytest.fixture
+def repository() -> _Repository:
+    return _Repository([
+        "Ticket to Ride",
+        "Ticket to Ride: Europe",
+        "Ticket to Ride: Europa 1912",
+        "Carcassonne",
+        "Wingspan",
+    ])
+
+
+def _matcher(repository, scorer, answer="2") -> LLMNameMatcher:
+    llm = mock.create_autospec(LLM, instance=True)
+    llm.get_response.return_value = answer
+    return LLMNameMatcher(repository=repository, llm_client=llm, scorer=scorer, fast_path=True)
+
+
+@pytest.mark.parametrize("scorer", SCORERS)
+def test_fast_path_rejects_runner_up_below_min_score_within_margin(repository, scorer):
+    matcher = _matcher(repository, scorer)
+    top = matcher._index.search("ticket to ride europa", n=2, cutoff=0.0)
+    assert top[0][1] >= matcher.fast_path_min_score
+    assert top[0][1] - top[1][1] < matcher.fast_path_min_margin
+    assert top[1][1] < matcher.fast_path_min_score
+
+    result = matcher.match("Ticket to Ride: Europa", "nl")
+
+    assert result.id == 2
+    assert matcher.stats["fast_path"] == 0
+    assert matcher.llm_client.get_response.call_count == 1
+
+
+@pytest.mark.parametrize("scorer", SCORERS)
+def test_fast_path_accepts_exact_unique_name(repository, scorer):
+    matcher = _matcher(repository, scorer)
+
+    result = matcher.match("Wingspan", "en")
+
+    assert result.id == 5
+    assert matcher.stats["fast_path"] == 1
+    matcher.llm_client.get_response.assert_not_called()
+
+
+def test_batch_answer_outside_own_candidates_falls_back_to_single_prompt(repository):
+    matcher = _matcher(repository, "trigram")
+    matcher.fast_path = False
+    # Game 1 gets game 2's candidate, as if the model mixed up the blocks
+    matcher.llm_client.get_response.side_effect = ['{"1": "5", "2": "5"}', "4"]
+
+    results = matcher.match_many([("Carcassonne", "en"), ("Wingspan", "en")])
+
+    assert [r.id for r in results] == [4, 5]
+    assert matcher.stats["llm_batch"] == 1
+    assert matcher.stats["llm"] == 1
+    single_prompt = matcher.llm_client.get_response.call_args_list[1].args[0][1]["content"]
+    assert "Carcassonne" in single_prompt and "Wingspan" not in single_prompt
+
+
+def test_single_block_reuses_candidates(repository):
+    matcher = _matcher(repository, "trigram", answer="4")
+    matcher.fast_path = False
+
+    with mock.patch.object(matcher, "_get_candidates", wraps=matcher._get_candidates) as get_candidates:
+        results = matcher.match_many([("Carcassonne", "en"), ("Qwxzy", "en")])
+
+    assert results[0].id == 4 and results[1] is None
+    assert get_candidates.call_count == 2  # Once per name, not again for the single prompt
+    assert matcher.stats["llm"] == 1
+
+
+def test_stats_are_counted_across_threads(repository):
+    matcher = _matcher(repository, "trigram")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: matcher.match("Wingspan", "en"), range(400)))
+
+    assert matcher.stats["fast_path"] == 400
@@ -0,0 +1,71 @@
+# tests/test_ocr_client.py
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from boardgamefinder.adapters import ocr_client
+from boardgamefinder.adapters.ocr_client import OcrClient
+from boardgamefinder.adapters.sqlite_cache import SqliteCache
+from boardgamefinder.domain.models import Listing
+
+
+def _listing() -> Listing:
+    return Listing(
+        title="Catan",
+        description="Compleet",
+        price=10.0,
+        price_type="FIXED",
+        link="https://www.marktplaats.nl/v/m1-catan",
+        city="Utrecht",
+        distance_km=3,
+        date="2025-01-01T12:00:00+00:00",
+        images=["https://images.marktplaats.com/1.jpg", "https://images.marktplaats.com/2.jpg"],
+    )
+
+
+def _vision_response(texts):
+    return SimpleNamespace(responses=[
+        SimpleNamespace(error=SimpleNamespace(message=""), text_annotations=[SimpleNamespace(description=t)])
+        for t in texts
+    ])
+
+
+@pytest.fixture
+def vision_client():
+    with mock.patch.object(ocr_client.vision, "ImageAnnotatorClient") as client_cls:
+        yield client_cls.return_value
+
+
+def _make_client(tmp_path, **kwargs) -> OcrClient:
+    return OcrClient(
+        url_cache=SqliteCache(str(tmp_path / "ocr.sqlite"), table="ocr_urls"),
+        content_cache=SqliteCache(str(tmp_path / "ocr.sqlite"), table="ocr_contents"),
+        **kwargs,
+    )
+
+
+def test_listing_images_are_cached_by_url(tmp_path, vision_client):
+    vision_client.batch_annotate_images.return_value = _vision_response(["CATAN", "EXPANSION"])
+    client = _make_client(tmp_path)
+    listing = _listing()
+
+    with mock.patch.object(client, "_download", side_effect=lambda url: url.encode("utf-8")):
+        assert client.extract_text_from_urls(listing.images) == ["CATAN", "EXPANSION"]
+        # The second call is served from the URL cache
+        assert client.extract_text_from_urls(listing.images) == ["CATAN", "EXPANSION"]
+
+    assert vision_client.batch_annotate_images.call_count == 1
+    assert client.url_cache.get("https://images.marktplaats.com/1.jpg") == "CATAN"
+
+
+def test_listing_images_as_image_uris(tmp_path, vision_client):
+    vision_client.batch_annotate_images.return_value = _vision_response(["CATAN", "EXPANSION"])
+    client = _make_client(tmp_path, use_image_uris=True)
+
+    assert client.extract_text_from_urls(_listing().images) == ["CATAN", "EXPANSION"]
+    sent = vision_client.batch_annotate_images.call_args.kwargs["requests"]
+    assert [r.image.source.image_uri for r in sent] == [
+        "https://images.marktplaats.com/1.jpg",
+        "https://images.marktplaats.com/2.jpg",
+    ]